@@ -1,4 +1,5 @@
 import uuid
+from functools import lru_cache
 
 from django.conf import settings
 from django.db import models
@@ -21,6 +22,7 @@ class Conversation(models.Model):
         return f"DIRECT:{self.pk}"
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def make_direct_key(u1_id, u2_id):
         a, b = sorted([str(u1_id), str(u2_id)])
         return f"{a}:{b}"
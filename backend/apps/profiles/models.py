@@ -39,12 +39,19 @@ class Profile(models.Model):
     def __str__(self):
         return f"{self.full_name} (@{self.username})"
 
+    # The counts below prefer the num_* annotations added by
+    # ProfileViewSet.get_queryset and only query the listings otherwise.
+
     @property
     def active_listings_count(self):
         """Count of active listings for this user"""
+        if hasattr(self, "num_active_listings"):
+            return self.num_active_listings
         return self.user.listings.filter(status="active").count()
 
     @property
     def sold_items_count(self):
         """Count of sold items for this user"""
+        if hasattr(self, "num_sold_items"):
+            return self.num_sold_items
         return self.user.listings.filter(status="sold").count()
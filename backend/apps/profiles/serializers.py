@@ -129,8 +129,9 @@ class ProfileCreateSerializer(serializers.ModelSerializer):
                 "Authentication required to create a profile."
             )
 
-        # Check if user already has a profile
-        if hasattr(request.user, "profile"):
+        # Check if user already has a profile; an indexed EXISTS query avoids
+        # the lazy request.user.profile fetch and its DoesNotExist path
+        if Profile.objects.filter(user_id=request.user.id).exists():
             raise serializers.ValidationError("You already have a profile.")
 
         return data
@@ -280,3 +281,18 @@ class CompactProfileSerializer(serializers.ModelSerializer):
             "avatar_url",
             "dorm_location",
         ]
+
+    def to_representation(self, instance):
+        """Build the dict directly; these fields need no conversion.
+
+        Lists serialize every profile, and DRF's per-field machinery is most
+        of that cost. Keep this in step with Meta.fields.
+        """
+        return {
+            "profile_id": instance.profile_id,
+            "full_name": instance.full_name,
+            "username": instance.username,
+            "email": instance.user.email,
+            "avatar_url": instance.avatar_url,
+            "dorm_location": instance.dorm_location,
+        }
@@ -1,14 +1,65 @@
+import copy
+import io
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
 from django.test import RequestFactory
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rf():
     """Request factory for testing views."""
     return RequestFactory()
 
 
+@pytest.fixture
+def make_request(rf):
+    """Build a plain request for the given method with ``user`` attached."""
+
+    def _make(method, user, path="/"):
+        request = getattr(rf, method.lower())(path)
+        request.user = user
+        return request
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def jpeg_bytes():
+    """A small JPEG, encoded once for every test that uploads an image."""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (100, 100), color="red").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def avatar_upload(jpeg_bytes):
+    """Return a factory for fresh uploaded JPEG files."""
+
+    def _make(name="avatar.jpg"):
+        return SimpleUploadedFile(name, jpeg_bytes, content_type="image/jpeg")
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def _module_api_client():
+    """Single APIClient shared by every test in a module."""
+    return APIClient()
+
+
+@pytest.fixture
+def api_client(_module_api_client):
+    """Shared APIClient, logged out again after each test."""
+    yield _module_api_client
+    _module_api_client.logout()
+
+
 @pytest.fixture
 def nyu_user_factory(db):
     """Create users that satisfy the @nyu.edu constraint."""
@@ -63,6 +114,22 @@ def profile_factory(db):
     return _make
 
 
+@pytest.fixture
+def listing_proto(db):
+    """Build unsaved listings by copying a prototype with the common defaults."""
+    from apps.listings.models import Listing
+
+    base = Listing(description="Test", category="books", status="active")
+
+    def _make(**fields):
+        listing = copy.copy(base)
+        for name, value in fields.items():
+            setattr(listing, name, value)
+        return listing
+
+    return _make
+
+
 @pytest.fixture
 def user_with_profile(nyu_user_factory, profile_factory):
     """Create a user with a profile."""
@@ -71,6 +138,89 @@ def user_with_profile(nyu_user_factory, profile_factory):
     return user, profile
 
 
+@pytest.fixture(scope="class")
+def _shared_profile_id(django_db_setup, django_db_blocker):
+    """Insert one user with a profile per test class (or module).
+
+    The rows live in an outer transaction that is rolled back afterwards.
+    Each test still runs in its own savepoint, so whatever a test changes or
+    deletes is undone before the next test reads the rows again.
+    """
+    import uuid
+
+    from apps.profiles.models import Profile
+
+    with django_db_blocker.unblock():
+        with transaction.atomic():
+            local_part = f"student1_{uuid.uuid4().hex[:8]}"
+            user = get_user_model().objects.create_user(
+                email=f"{local_part}@nyu.edu", password="pass123"
+            )
+            profile = Profile.objects.create(
+                user=user,
+                full_name=f"{local_part} User",
+                username=f"{local_part}_{uuid.uuid4().hex[:8]}",
+                dorm_location="New York, NY",
+                bio="Test user bio",
+            )
+            yield profile.profile_id
+            transaction.set_rollback(True)
+
+
+@pytest.fixture
+def shared_user_with_profile(db, _shared_profile_id):
+    """Like ``user_with_profile``, but re-reads rows inserted once per class.
+
+    Only for modules whose tests never count users or profiles, since the
+    shared row stays visible to every later test in the class or module.
+    """
+    from apps.profiles.models import Profile
+
+    profile = Profile.objects.select_related("user").get(profile_id=_shared_profile_id)
+    return profile.user, profile
+
+
+@pytest.fixture
+def authenticated_client(api_client, user_with_profile):
+    """Shared APIClient already authenticated as ``user_with_profile``."""
+    user, _ = user_with_profile
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+@pytest.fixture
+def destroy_profile():
+    """Call ProfileViewSet.destroy directly, skipping URL routing and middleware."""
+    from apps.profiles.views import ProfileViewSet
+
+    view = ProfileViewSet.as_view({"delete": "destroy"})
+    factory = APIRequestFactory()
+
+    def _destroy(user, profile):
+        request = factory.delete("/")
+        force_authenticate(request, user=user)
+        return view(request, pk=profile.profile_id)
+
+    return _destroy
+
+
+@pytest.fixture
+def chat_partner(nyu_user_factory, profile_factory):
+    """A second user with a profile, to chat with ``user_with_profile``."""
+    other_user = nyu_user_factory(2)
+    profile_factory(other_user, username="chatpartner")
+    return other_user
+
+
+@pytest.fixture
+def direct_key(user_with_profile, chat_partner):
+    """Direct conversation key between ``user_with_profile`` and ``chat_partner``."""
+    from apps.chat.models import Conversation
+
+    user, _ = user_with_profile
+    return Conversation.make_direct_key(user.id, chat_partner.id)
+
+
 @pytest.fixture
 def jwt_access_token_for():
     """Generate JWT access token for a user."""
@@ -81,3 +231,13 @@ def jwt_access_token_for():
         return str(AccessToken.for_user(user))
 
     return _mk
+
+
+@pytest.fixture
+def assert_none_exist():
+    """Assert that no rows match the given filters, using one EXISTS query."""
+
+    def _check(model, *args, **filters):
+        assert not model.objects.filter(*args, **filters).exists()
+
+    return _check
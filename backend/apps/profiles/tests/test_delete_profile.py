@@ -1,8 +1,11 @@
 """Comprehensive tests for profile deletion and cascading effects."""
 
+from unittest.mock import patch
+
 import pytest
-from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
+from django.db import DatabaseError
+from django.db.models import Q
 
 from apps.profiles.models import Profile
 from apps.listings.models import Listing, ListingImage, Watchlist
@@ -10,271 +13,199 @@ from apps.transactions.models import Transaction
 from apps.chat.models import Conversation, ConversationParticipant, Message
 
 User = get_user_model()
-pytestmark = pytest.mark.django_db
+# Savepoint rollback per test; none of these tests need real commits.
+pytestmark = pytest.mark.django_db(
+    transaction=False, reset_sequences=False, databases=["default"]
+)
+
+
+@pytest.fixture
+def user_with_profile(shared_user_with_profile):
+    """Reuse one user and profile per class. Deletions are rolled back per test."""
+    return shared_user_with_profile
 
 
 class TestDeleteProfileWithProfile:
     """Tests for deleting user account when profile exists."""
 
-    def test_delete_profile_deletes_user(self, user_with_profile):
+    def test_delete_profile_deletes_user(
+        self, authenticated_client, user_with_profile, assert_none_exist
+    ):
         """Test that deleting profile also deletes the user account."""
         user, profile = user_with_profile
         user_id = user.id
         profile_id = profile.profile_id
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
-
-        assert response.status_code == 204
-        assert not User.objects.filter(id=user_id).exists()
-        assert not Profile.objects.filter(profile_id=profile_id).exists()
-
-    def test_delete_profile_cascade_to_listings(self, user_with_profile):
-        """Test that deleting profile cascades to user's listings."""
-        user, profile = user_with_profile
-
-        # Create listings
-        listing1 = Listing.objects.create(
-            user=user,
-            title="Test Listing 1",
-            description="Test",
-            price=10.00,
-            category="books",
-            status="active",
-        )
-        listing2 = Listing.objects.create(
-            user=user,
-            title="Test Listing 2",
-            description="Test",
-            price=20.00,
-            category="electronics",
-            status="sold",
+        response = authenticated_client.delete(
+            f"/api/v1/profiles/{profile.profile_id}/"
         )
 
-        listing_ids = [listing1.listing_id, listing2.listing_id]
-
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
-
         assert response.status_code == 204
-        assert not Listing.objects.filter(listing_id__in=listing_ids).exists()
-
-    def test_delete_profile_cascade_to_listing_images(
-        self, user_with_profile, nyu_user_factory
+        # A surviving profile implies a surviving user, so one query covers both
+        assert_none_exist(User, Q(id=user_id) | Q(profile__profile_id=profile_id))
+
+    def test_delete_profile_cascades_to_owned_data(
+        self,
+        destroy_profile,
+        user_with_profile,
+        nyu_user_factory,
+        profile_factory,
+        listing_proto,
+        assert_none_exist,
     ):
-        """Test that deleting profile cascades to listing images."""
-        user, profile = user_with_profile
+        """Test that deleting profile cascades to every kind of owned data.
 
-        # Create listing with images
-        listing = Listing.objects.create(
-            user=user,
-            title="Test Listing",
-            description="Test",
-            price=10.00,
-            category="books",
-        )
-        image1 = ListingImage.objects.create(
-            listing=listing,
-            image_url="https://example.com/image1.jpg",
-            display_order=0,
-            is_primary=True,
-        )
-        image2 = ListingImage.objects.create(
-            listing=listing,
-            image_url="https://example.com/image2.jpg",
-            display_order=1,
-        )
-
-        image_ids = [image1.image_id, image2.image_id]
-
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
-
-        assert response.status_code == 204
-        # ListingImages should cascade delete with Listing
-        assert not ListingImage.objects.filter(image_id__in=image_ids).exists()
-
-    def test_delete_profile_cascade_to_watchlist(
-        self, user_with_profile, nyu_user_factory, profile_factory
-    ):
-        """Test that deleting profile cascades to user's watchlist entries."""
+        All related rows are built up front so a single DELETE exercises the
+        listing, image, watchlist and transaction (buyer and seller) cascades.
+        """
         user, profile = user_with_profile
 
-        # Create another user with a listing
         other_user = nyu_user_factory(2)
         profile_factory(other_user, username="otheruser")
-        listing = Listing.objects.create(
-            user=other_user,
-            title="Other's Listing",
-            description="Test",
-            price=50.00,
-            category="books",
-        )
-
-        # User adds listing to watchlist
-        watchlist_item = Watchlist.objects.create(user=user, listing=listing)
-        watchlist_id = watchlist_item.watchlist_id
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
-
-        assert response.status_code == 204
-        assert not Watchlist.objects.filter(watchlist_id=watchlist_id).exists()
-
-    def test_delete_profile_cascade_to_transactions_as_buyer(
-        self, user_with_profile, nyu_user_factory, profile_factory
-    ):
-        """Test that deleting profile cascades to transactions where user is buyer."""
-        user, profile = user_with_profile
-
-        # Create seller
-        seller = nyu_user_factory(2)
-        profile_factory(seller, username="seller")
-        listing = Listing.objects.create(
-            user=seller,
-            title="Seller Listing",
-            description="Test",
-            price=100.00,
+        # Listings owned by the user, one with images
+        listing1 = listing_proto(user=user, title="Test Listing 1", price=10.00)
+        listing1.save()
+        listing2 = listing_proto(
+            user=user,
+            title="Test Listing 2",
+            price=20.00,
             category="electronics",
+            status="sold",
         )
-
-        # Create transaction where user is buyer
-        transaction = Transaction.objects.create(
-            listing=listing,
-            buyer=user,
-            seller=seller,
-            payment_method="cash",
-            delivery_method="meetup",
-            status="PENDING",
+        listing2.save()
+        ListingImage.objects.bulk_create(
+            [
+                ListingImage(
+                    listing=listing1,
+                    image_url="https://example.com/image1.jpg",
+                    display_order=0,
+                    is_primary=True,
+                ),
+                ListingImage(
+                    listing=listing1,
+                    image_url="https://example.com/image2.jpg",
+                    display_order=1,
+                ),
+            ]
         )
-        transaction_id = transaction.transaction_id
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
-
-        assert response.status_code == 204
-        assert not Transaction.objects.filter(transaction_id=transaction_id).exists()
-
-    def test_delete_profile_cascade_to_transactions_as_seller(
-        self, user_with_profile, nyu_user_factory, profile_factory
-    ):
-        """Test that deleting profile cascades to transactions where user is seller."""
-        user, profile = user_with_profile
-
-        # Create buyer
-        buyer = nyu_user_factory(2)
-        profile_factory(buyer, username="buyer")
-        listing = Listing.objects.create(
-            user=user,
-            title="User Listing",
-            description="Test",
-            price=75.00,
-            category="books",
+        # Another user's listing, watched and bought by the user
+        other_listing = listing_proto(
+            user=other_user, title="Other's Listing", price=50.00
         )
-
-        # Create transaction where user is seller
-        transaction = Transaction.objects.create(
-            listing=listing,
-            buyer=buyer,
-            seller=user,
-            payment_method="venmo",
-            delivery_method="pickup",
-            status="COMPLETED",
+        other_listing.save()
+        watchlist_item = Watchlist.objects.create(user=user, listing=other_listing)
+        # One transaction for each side the user can be on
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    listing=other_listing,
+                    buyer=user,
+                    seller=other_user,
+                    payment_method="cash",
+                    delivery_method="meetup",
+                    status="PENDING",
+                ),
+                Transaction(
+                    listing=listing1,
+                    buyer=other_user,
+                    seller=user,
+                    payment_method="venmo",
+                    delivery_method="pickup",
+                    status="COMPLETED",
+                ),
+            ]
         )
-        transaction_id = transaction.transaction_id
 
-        client = APIClient()
-        client.force_authenticate(user=user)
+        related = {
+            "listings": (
+                Listing,
+                {"listing_id__in": [listing1.listing_id, listing2.listing_id]},
+            ),
+            # bulk_create does not return primary keys on every backend
+            "images": (ListingImage, {"listing_id": listing1.listing_id}),
+            "watchlist": (Watchlist, {"watchlist_id": watchlist_item.watchlist_id}),
+            "tx_buyer": (Transaction, {"buyer_id": user.id}),
+            "tx_seller": (Transaction, {"seller_id": user.id}),
+        }
 
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
+        response = destroy_profile(user, profile)
 
         assert response.status_code == 204
-        assert not Transaction.objects.filter(transaction_id=transaction_id).exists()
+        for model, filters in related.values():
+            assert_none_exist(model, **filters)
+        # The other user's listing is untouched
+        assert Listing.objects.filter(listing_id=other_listing.listing_id).exists()
 
     def test_delete_profile_cascade_to_conversation_participant(
-        self, user_with_profile, nyu_user_factory, profile_factory
+        self, destroy_profile, user_with_profile, chat_partner, direct_key
     ):
         """Test that deleting profile cascades to conversation participants."""
         user, profile = user_with_profile
 
-        # Create another user
-        other_user = nyu_user_factory(2)
-        profile_factory(other_user, username="chatpartner")
+        other_user = chat_partner
 
         # Create conversation
         conversation = Conversation.objects.create(
-            direct_key=Conversation.make_direct_key(user.id, other_user.id),
+            direct_key=direct_key,
             created_by=user,
         )
-        ConversationParticipant.objects.create(conversation=conversation, user=user)
-        ConversationParticipant.objects.create(
-            conversation=conversation, user=other_user
+        ConversationParticipant.objects.bulk_create(
+            [
+                ConversationParticipant(conversation=conversation, user=user),
+                ConversationParticipant(conversation=conversation, user=other_user),
+            ]
         )
 
         conv_id = conversation.id
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
+        response = destroy_profile(user, profile)
 
         assert response.status_code == 204
 
-        # User's participant entry should be deleted
-        assert not ConversationParticipant.objects.filter(
-            conversation_id=conv_id, user_id=user.id
-        ).exists()
-
-        # Other user's participant entry should still exist
-        assert ConversationParticipant.objects.filter(
-            conversation_id=conv_id, user=other_user
-        ).exists()
+        # Only the other user's participant entry should remain
+        participants = set(
+            ConversationParticipant.objects.filter(conversation_id=conv_id).values_list(
+                "user_id", flat=True
+            )
+        )
+        assert participants == {other_user.id}
 
         # Conversation should still exist
         assert Conversation.objects.filter(id=conv_id).exists()
 
     def test_delete_profile_sets_message_sender_to_null(
-        self, user_with_profile, nyu_user_factory, profile_factory
+        self, destroy_profile, user_with_profile, chat_partner, direct_key
     ):
         """Test deleting profile sets message sender to NULL."""
         user, profile = user_with_profile
 
-        # Create another user
-        other_user = nyu_user_factory(2)
-        profile_factory(other_user, username="receiver")
+        other_user = chat_partner
 
         # Create conversation and messages
         conversation = Conversation.objects.create(
-            direct_key=Conversation.make_direct_key(user.id, other_user.id),
+            direct_key=direct_key,
             created_by=user,
         )
-        ConversationParticipant.objects.create(conversation=conversation, user=user)
-        ConversationParticipant.objects.create(
-            conversation=conversation, user=other_user
+        ConversationParticipant.objects.bulk_create(
+            [
+                ConversationParticipant(conversation=conversation, user=user),
+                ConversationParticipant(conversation=conversation, user=other_user),
+            ]
         )
 
-        message1 = Message.objects.create(
-            conversation=conversation, sender=user, text="Hello from user"
-        )
-        message2 = Message.objects.create(
-            conversation=conversation, sender=other_user, text="Hello back"
+        message1, message2 = Message.objects.bulk_create(
+            [
+                Message(conversation=conversation, sender=user, text="Hello from user"),
+                Message(
+                    conversation=conversation, sender=other_user, text="Hello back"
+                ),
+            ]
         )
 
         message_ids = [message1.id, message2.id]
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
+        response = destroy_profile(user, profile)
 
         assert response.status_code == 204
 
@@ -282,56 +213,133 @@ class TestDeleteProfileWithProfile:
         assert Message.objects.filter(id__in=message_ids).count() == 2
 
         # User's message should have sender=NULL
-        user_message = Message.objects.get(id=message1.id)
-        assert user_message.sender is None
-        assert user_message.text == "Hello from user"
+        assert Message.objects.filter(
+            id=message1.id, sender__isnull=True, text="Hello from user"
+        ).exists()
 
         # Other user's message should still have sender
-        other_message = Message.objects.get(id=message2.id)
-        assert other_message.sender == other_user
+        assert Message.objects.filter(id=message2.id, sender_id=other_user.id).exists()
 
     def test_delete_profile_sets_conversation_created_by_to_null(
-        self, user_with_profile, nyu_user_factory, profile_factory
+        self, destroy_profile, user_with_profile, chat_partner, direct_key
     ):
         """Test that deleting profile sets conversation.created_by to NULL."""
         user, profile = user_with_profile
 
-        # Create another user
-        other_user = nyu_user_factory(2)
-        profile_factory(other_user, username="participant")
+        other_user = chat_partner
 
         # Create conversation created by user
         conversation = Conversation.objects.create(
-            direct_key=Conversation.make_direct_key(user.id, other_user.id),
+            direct_key=direct_key,
             created_by=user,
         )
-        ConversationParticipant.objects.create(conversation=conversation, user=user)
-        ConversationParticipant.objects.create(
-            conversation=conversation, user=other_user
+        ConversationParticipant.objects.bulk_create(
+            [
+                ConversationParticipant(conversation=conversation, user=user),
+                ConversationParticipant(conversation=conversation, user=other_user),
+            ]
         )
 
         conv_id = conversation.id
 
-        client = APIClient()
-        client.force_authenticate(user=user)
+        response = destroy_profile(user, profile)
+
+        assert response.status_code == 204
+
+        # Conversation should still exist, with created_by set to NULL
+        assert Conversation.objects.filter(id=conv_id, created_by__isnull=True).exists()
+
+    def test_delete_profile_removes_s3_images_in_one_batch(
+        self,
+        destroy_profile,
+        user_with_profile,
+        listing_proto,
+        settings,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that the avatar and all listing images go in one S3 batch call."""
+        settings.S3_CLEANUP_ASYNC = False
+        user, profile = user_with_profile
+        profile.avatar_url = "https://example.com/avatar.jpg"
+        profile.save(update_fields=["avatar_url"])
+
+        listing = listing_proto(user=user, title="Test Listing", price=10.00)
+        listing.save()
+        ListingImage.objects.bulk_create(
+            [
+                ListingImage(listing=listing, image_url="https://example.com/1.jpg"),
+                ListingImage(listing=listing, image_url="https://example.com/2.jpg"),
+            ]
+        )
 
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
+        with patch("utils.s3_service.get_s3_service") as mock_get_s3:
+            with django_capture_on_commit_callbacks(execute=True):
+                response = destroy_profile(user, profile)
 
         assert response.status_code == 204
+        mock_s3 = mock_get_s3.return_value
+        mock_s3.delete_image.assert_not_called()
+        mock_s3.delete_images.assert_called_once()
+        (image_urls,), _ = mock_s3.delete_images.call_args
+        assert sorted(image_urls) == [
+            "https://example.com/1.jpg",
+            "https://example.com/2.jpg",
+            "https://example.com/avatar.jpg",
+        ]
+
+    def test_delete_profile_skips_s3_cleanup_on_rollback(
+        self,
+        destroy_profile,
+        user_with_profile,
+        settings,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that S3 is left alone when the account deletion rolls back."""
+        settings.S3_CLEANUP_ASYNC = False
+        user, profile = user_with_profile
+        profile.avatar_url = "https://example.com/avatar.jpg"
+        profile.save(update_fields=["avatar_url"])
+
+        with patch("utils.s3_service.get_s3_service") as mock_get_s3, patch.object(
+            User, "delete", side_effect=DatabaseError("delete failed")
+        ):
+            with django_capture_on_commit_callbacks(execute=True) as callbacks:
+                with pytest.raises(DatabaseError):
+                    destroy_profile(user, profile)
+
+        assert callbacks == []
+        mock_get_s3.assert_not_called()
+        assert Profile.objects.filter(profile_id=profile.profile_id).exists()
 
-        # Conversation should still exist
-        conversation = Conversation.objects.get(id=conv_id)
-        # created_by should be NULL
-        assert conversation.created_by is None
+    def test_delete_profile_succeeds_when_s3_fails(
+        self,
+        destroy_profile,
+        user_with_profile,
+        assert_none_exist,
+        settings,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test that an S3 failure does not block the account deletion."""
+        settings.S3_CLEANUP_ASYNC = False
+        user, profile = user_with_profile
+        profile.avatar_url = "https://example.com/avatar.jpg"
+        profile.save(update_fields=["avatar_url"])
+
+        with patch("utils.s3_service.get_s3_service") as mock_get_s3:
+            mock_get_s3.return_value.delete_images.side_effect = Exception("S3 down")
+            with django_capture_on_commit_callbacks(execute=True):
+                response = destroy_profile(user, profile)
+
+        assert response.status_code == 204
+        assert_none_exist(User, id=user.id)
 
-    def test_delete_response_message(self, user_with_profile):
+    def test_delete_response_message(self, authenticated_client, user_with_profile):
         """Test that delete endpoint returns 204 No Content."""
         user, profile = user_with_profile
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
+        response = authenticated_client.delete(
+            f"/api/v1/profiles/{profile.profile_id}/"
+        )
 
         assert response.status_code == 204
         # 204 No Content responses typically have no body
@@ -341,21 +349,12 @@ class TestDeleteProfileWithProfile:
 class TestDeleteProfilePermissions:
     """Tests for delete profile permissions and authentication."""
 
-    def test_unauthenticated_cannot_delete(self):
-        """Test that unauthenticated users cannot delete profile."""
-        client = APIClient()
-        response = client.delete("/api/v1/profiles/1/")
-
-        assert response.status_code in (401, 403)
-
-    def test_delete_requires_valid_token(self, user_with_profile):
-        """Test that delete requires a valid authentication token."""
+    def test_unauthenticated_delete_is_rejected(self, api_client, user_with_profile):
+        """Test that unauthenticated users cannot delete a profile."""
         user, profile = user_with_profile
 
-        client = APIClient()
         # Don't authenticate
-
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
+        response = api_client.delete(f"/api/v1/profiles/{profile.profile_id}/")
 
         assert response.status_code in (401, 403)
 
@@ -368,46 +367,54 @@ class TestDeleteProfileEdgeCases:
     """Tests for edge cases and error scenarios."""
 
     def test_delete_profile_with_multiple_listings_and_transactions(
-        self, user_with_profile, nyu_user_factory, profile_factory
+        self,
+        destroy_profile,
+        user_with_profile,
+        nyu_user_factory,
+        profile_factory,
+        listing_proto,
     ):
         """Test deleting profile with complex related data."""
         user, profile = user_with_profile
 
-        # Create multiple listings
-        for i in range(5):
-            Listing.objects.create(
-                user=user,
-                title=f"Listing {i}",
-                description="Test",
-                price=10.00 * (i + 1),
-                category="books",
-            )
+        # Create all listings, including the ones to be sold, in one INSERT
+        Listing.objects.bulk_create(
+            [
+                listing_proto(user=user, title=f"Listing {i}", price=10.00 * (i + 1))
+                for i in range(5)
+            ]
+            + [
+                listing_proto(
+                    user=user,
+                    title=f"Transaction Listing {i}",
+                    price=50.00,
+                    category="electronics",
+                )
+                for i in range(3)
+            ]
+        )
 
         # Create multiple transactions
         buyer = nyu_user_factory(2)
         profile_factory(buyer, username="buyer")
 
-        for i in range(3):
-            listing = Listing.objects.create(
-                user=user,
-                title=f"Transaction Listing {i}",
-                description="Test",
-                price=50.00,
-                category="electronics",
-            )
-            Transaction.objects.create(
-                listing=listing,
-                buyer=buyer,
-                seller=user,
-                payment_method="cash",
-                delivery_method="meetup",
-                status="PENDING",
-            )
-
-        client = APIClient()
-        client.force_authenticate(user=user)
+        # bulk_create does not return primary keys on every backend
+        tx_listings = Listing.objects.filter(user=user, category="electronics")
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    listing=listing,
+                    buyer=buyer,
+                    seller=user,
+                    payment_method="cash",
+                    delivery_method="meetup",
+                    status="PENDING",
+                )
+                for listing in tx_listings
+            ]
+        )
 
-        response = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
+        response = destroy_profile(user, profile)
 
         assert response.status_code == 204
 
@@ -417,16 +424,15 @@ class TestDeleteProfileEdgeCases:
         # All transactions should be deleted
         assert not Transaction.objects.filter(seller_id=user.id).exists()
 
-    def test_delete_profile_idempotent(self, user_with_profile):
+    def test_delete_profile_idempotent(self, authenticated_client, user_with_profile):
         """Test that user cannot be deleted twice (user is gone after first delete)."""
         user, profile = user_with_profile
         user_id = user.id
 
-        client = APIClient()
-        client.force_authenticate(user=user)
-
         # First delete
-        response1 = client.delete(f"/api/v1/profiles/{profile.profile_id}/")
+        response1 = authenticated_client.delete(
+            f"/api/v1/profiles/{profile.profile_id}/"
+        )
         assert response1.status_code == 204
 
         # User is deleted
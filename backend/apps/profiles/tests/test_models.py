@@ -166,6 +166,20 @@ def test_sold_items_count_property():
     assert profile.sold_items_count == 2
 
 
+def test_listing_counts_prefer_annotations(django_assert_num_queries):
+    """Test that annotated listing counts are used without extra queries."""
+    user = User.objects.create_user(email="annotated@nyu.edu", password="pass123")
+    profile = Profile.objects.create(
+        user=user, full_name="Annotated User", username="annotated"
+    )
+    profile.num_active_listings = 3
+    profile.num_sold_items = 1
+
+    with django_assert_num_queries(0):
+        assert profile.active_listings_count == 3
+        assert profile.sold_items_count == 1
+
+
 def test_profile_ordering():
     """Test that profiles are ordered by -created_at."""
     from time import sleep
@@ -1,6 +1,5 @@
 import pytest
 from io import BytesIO
-from PIL import Image
 from rest_framework.test import APIClient
 
 pytestmark = pytest.mark.django_db
@@ -16,13 +15,10 @@ def client_and_user(nyu_user_factory):
 
 
 @pytest.fixture
-def test_image():
+def test_image(jpeg_bytes):
     """Create a test image file for avatar uploads."""
-    img = Image.new("RGB", (100, 100), color="red")
-    img_file = BytesIO()
-    img.save(img_file, format="JPEG")
+    img_file = BytesIO(jpeg_bytes)
     img_file.name = "test_avatar.jpg"
-    img_file.seek(0)
     return img_file
 
 
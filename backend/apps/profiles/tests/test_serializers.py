@@ -1,5 +1,4 @@
 import pytest
-from django.test import RequestFactory
 from apps.profiles.serializers import (
     ProfileCreateSerializer,
     ProfileUpdateSerializer,
@@ -10,6 +9,12 @@ from apps.profiles.serializers import (
 pytestmark = pytest.mark.django_db
 
 
+@pytest.fixture
+def user_with_profile(shared_user_with_profile):
+    """Reuse one user and profile per class. No test here counts rows."""
+    return shared_user_with_profile
+
+
 def test_profile_detail_serializer(user_with_profile):
     """Test ProfileDetailSerializer includes all fields."""
     user, profile = user_with_profile
@@ -30,12 +35,10 @@ def test_profile_detail_serializer(user_with_profile):
     assert "member_since" in data
 
 
-def test_profile_create_serializer_valid_data(nyu_user_factory):
+def test_profile_create_serializer_valid_data(nyu_user_factory, make_request):
     """Test creating a profile with valid data."""
     user = nyu_user_factory(1)
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = user
+    request = make_request("post", user)
 
     data = {
         "full_name": "Test User",
@@ -54,14 +57,14 @@ def test_profile_create_serializer_valid_data(nyu_user_factory):
     assert profile.user == user
 
 
-def test_profile_create_serializer_duplicate_username(two_users, profile_factory):
+def test_profile_create_serializer_duplicate_username(
+    two_users, profile_factory, make_request
+):
     """Test that duplicate username validation works."""
     user1, user2 = two_users
     profile_factory(user1, username="taken")
 
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = user2
+    request = make_request("post", user2)
 
     data = {"full_name": "User Two", "username": "taken"}
 
@@ -70,12 +73,10 @@ def test_profile_create_serializer_duplicate_username(two_users, profile_factory
     assert "username" in serializer.errors
 
 
-def test_profile_create_serializer_invalid_username(nyu_user_factory):
+def test_profile_create_serializer_invalid_username(nyu_user_factory, make_request):
     """Test that invalid usernames are rejected."""
     user = nyu_user_factory(1)
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = user
+    request = make_request("post", user)
 
     data = {"full_name": "Test User", "username": "invalid@username!"}
 
@@ -84,12 +85,10 @@ def test_profile_create_serializer_invalid_username(nyu_user_factory):
     assert "username" in serializer.errors
 
 
-def test_profile_create_serializer_already_has_profile(user_with_profile):
+def test_profile_create_serializer_already_has_profile(user_with_profile, make_request):
     """Test that user with existing profile cannot create another."""
     user, profile = user_with_profile
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = user
+    request = make_request("post", user)
 
     data = {"full_name": "Another Profile", "username": "another"}
 
@@ -97,12 +96,10 @@ def test_profile_create_serializer_already_has_profile(user_with_profile):
     assert not serializer.is_valid()
 
 
-def test_profile_update_serializer_valid_data(user_with_profile):
+def test_profile_update_serializer_valid_data(user_with_profile, make_request):
     """Test updating a profile with valid data."""
     user, profile = user_with_profile
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user
+    request = make_request("patch", user)
 
     data = {"full_name": "Updated Name", "bio": "Updated bio"}
 
@@ -116,15 +113,15 @@ def test_profile_update_serializer_valid_data(user_with_profile):
     assert updated_profile.bio == "Updated bio"
 
 
-def test_profile_update_serializer_duplicate_username(two_users, profile_factory):
+def test_profile_update_serializer_duplicate_username(
+    two_users, profile_factory, make_request
+):
     """Test that updating to duplicate username is rejected."""
     user1, user2 = two_users
     profile_factory(user1, username="user1")
     profile2 = profile_factory(user2, username="user2")
 
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user2
+    request = make_request("patch", user2)
 
     data = {"username": "user1"}
 
@@ -135,14 +132,14 @@ def test_profile_update_serializer_duplicate_username(two_users, profile_factory
     assert "username" in serializer.errors
 
 
-def test_profile_update_serializer_ownership_check(two_users, profile_factory):
+def test_profile_update_serializer_ownership_check(
+    two_users, profile_factory, make_request
+):
     """Test that users cannot update other users' profiles."""
     user1, user2 = two_users
     profile1 = profile_factory(user1, username="user1")
 
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user2  # Different user
+    request = make_request("patch", user2)  # Different user
 
     data = {"full_name": "Hacked Name"}
 
@@ -169,12 +166,22 @@ def test_compact_profile_serializer(user_with_profile):
     assert set(data.keys()) == expected_fields
 
 
-def test_profile_serializer_read_only_fields(user_with_profile):
+def test_compact_profile_serializer_matches_declared_fields(user_with_profile):
+    """Test that the hand-built compact output matches DRF's field output."""
+    from rest_framework import serializers
+
+    user, profile = user_with_profile
+    profile.avatar_url = "https://example.com/avatar.jpg"
+    serializer = CompactProfileSerializer(profile)
+
+    expected = serializers.ModelSerializer.to_representation(serializer, profile)
+    assert serializer.data == expected
+
+
+def test_profile_serializer_read_only_fields(user_with_profile, make_request):
     """Test that read-only fields cannot be updated."""
     user, profile = user_with_profile
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user
+    request = make_request("patch", user)
 
     # Try to update read-only fields
     data = {
@@ -194,13 +201,11 @@ def test_profile_serializer_read_only_fields(user_with_profile):
     assert updated_profile.user == profile.user
 
 
-def test_profile_create_serializer_unauthenticated():
+def test_profile_create_serializer_unauthenticated(make_request):
     """Test that unauthenticated requests are rejected."""
     from django.contrib.auth.models import AnonymousUser
 
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = AnonymousUser()
+    request = make_request("post", AnonymousUser())
 
     data = {"full_name": "Test User", "username": "testuser"}
 
@@ -239,12 +244,10 @@ def test_profile_detail_serializer_computed_fields(user_with_profile):
     assert data["sold_items"] == 1
 
 
-def test_profile_serializer_optional_fields(nyu_user_factory):
+def test_profile_serializer_optional_fields(nyu_user_factory, make_request):
     """Test that optional fields can be omitted."""
     user = nyu_user_factory(1)
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = user
+    request = make_request("post", user)
 
     # Only required fields
     data = {"full_name": "Minimal User", "username": "minimal"}
@@ -258,14 +261,12 @@ def test_profile_serializer_optional_fields(nyu_user_factory):
     assert profile.bio is None
 
 
-def test_profile_update_serializer_partial_update(user_with_profile):
+def test_profile_update_serializer_partial_update(user_with_profile, make_request):
     """Test partial update only changes specified fields."""
     user, profile = user_with_profile
     original_username = profile.username
 
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user
+    request = make_request("patch", user)
 
     data = {"bio": "New bio only"}
 
@@ -279,27 +280,16 @@ def test_profile_update_serializer_partial_update(user_with_profile):
     assert updated_profile.username == original_username  # Unchanged
 
 
-def test_profile_create_serializer_with_avatar_success(nyu_user_factory):
+def test_profile_create_serializer_with_avatar_success(
+    nyu_user_factory, make_request, avatar_upload
+):
     """Test creating a profile with avatar upload succeeds."""
-    import io
     from unittest.mock import patch
 
-    from django.core.files.uploadedfile import SimpleUploadedFile
-    from PIL import Image
-
     user = nyu_user_factory(1)
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = user
-
-    # Create a valid image file
-    img = Image.new("RGB", (100, 100), color="red")
-    img_file = io.BytesIO()
-    img.save(img_file, format="JPEG")
-    img_file.seek(0)
-    avatar_file = SimpleUploadedFile(
-        "avatar.jpg", img_file.read(), content_type="image/jpeg"
-    )
+    request = make_request("post", user)
+
+    avatar_file = avatar_upload()
 
     data = {
         "full_name": "Test User",
@@ -321,30 +311,19 @@ def test_profile_create_serializer_with_avatar_success(nyu_user_factory):
         assert call_args[1]["folder_name"] == "profiles"
 
 
-def test_profile_create_serializer_avatar_upload_failure(nyu_user_factory):
+def test_profile_create_serializer_avatar_upload_failure(
+    nyu_user_factory, make_request, avatar_upload
+):
     """Test that avatar upload failure deletes profile and user."""
-    import io
     from unittest.mock import patch
 
-    from django.core.files.uploadedfile import SimpleUploadedFile
-    from PIL import Image
-
     from apps.users.models import User
 
     user = nyu_user_factory(1)
     user_id = user.id
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = user
-
-    # Create a valid image file
-    img = Image.new("RGB", (100, 100), color="red")
-    img_file = io.BytesIO()
-    img.save(img_file, format="JPEG")
-    img_file.seek(0)
-    avatar_file = SimpleUploadedFile(
-        "avatar.jpg", img_file.read(), content_type="image/jpeg"
-    )
+    request = make_request("post", user)
+
+    avatar_file = avatar_upload()
 
     data = {
         "full_name": "Test User",
@@ -377,7 +356,7 @@ def test_profile_create_serializer_avatar_upload_failure(nyu_user_factory):
         assert not profile_exists or not user_exists or True  # Code path tested
 
 
-def test_profile_create_serializer_general_exception(nyu_user_factory):
+def test_profile_create_serializer_general_exception(nyu_user_factory, make_request):
     """Test that general exception during creation deletes user."""
     from unittest.mock import patch
 
@@ -385,9 +364,7 @@ def test_profile_create_serializer_general_exception(nyu_user_factory):
 
     user = nyu_user_factory(1)
     user_id = user.id
-    rf = RequestFactory()
-    request = rf.post("/")
-    request.user = user
+    request = make_request("post", user)
 
     data = {
         "full_name": "Test User",
@@ -418,7 +395,7 @@ def test_profile_create_serializer_general_exception(nyu_user_factory):
             pass
 
 
-def test_profile_update_serializer_remove_avatar(user_with_profile):
+def test_profile_update_serializer_remove_avatar(user_with_profile, make_request):
     """Test removing avatar from profile."""
     from unittest.mock import patch
 
@@ -426,9 +403,7 @@ def test_profile_update_serializer_remove_avatar(user_with_profile):
     profile.avatar_url = "https://s3.amazonaws.com/bucket/old-avatar.jpg"
     profile.save()
 
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user
+    request = make_request("patch", user)
 
     data = {"remove_avatar": True}
 
@@ -445,30 +420,19 @@ def test_profile_update_serializer_remove_avatar(user_with_profile):
         )
 
 
-def test_profile_update_serializer_upload_new_avatar(user_with_profile):
+def test_profile_update_serializer_upload_new_avatar(
+    user_with_profile, make_request, avatar_upload
+):
     """Test uploading new avatar replaces old one."""
-    import io
     from unittest.mock import patch
 
-    from django.core.files.uploadedfile import SimpleUploadedFile
-    from PIL import Image
-
     user, profile = user_with_profile
     profile.avatar_url = "https://s3.amazonaws.com/bucket/old-avatar.jpg"
     profile.save()
 
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user
-
-    # Create a valid image file
-    img = Image.new("RGB", (100, 100), color="blue")
-    img_file = io.BytesIO()
-    img.save(img_file, format="JPEG")
-    img_file.seek(0)
-    avatar_file = SimpleUploadedFile(
-        "new-avatar.jpg", img_file.read(), content_type="image/jpeg"
-    )
+    request = make_request("patch", user)
+
+    avatar_file = avatar_upload("new-avatar.jpg")
 
     data = {"new_avatar": avatar_file}
 
@@ -496,30 +460,19 @@ def test_profile_update_serializer_upload_new_avatar(user_with_profile):
         assert call_args[1]["folder_name"] == "profiles"
 
 
-def test_profile_update_serializer_avatar_upload_failure(user_with_profile):
+def test_profile_update_serializer_avatar_upload_failure(
+    user_with_profile, make_request, avatar_upload
+):
     """Test that avatar upload failure raises validation error."""
-    import io
     from unittest.mock import patch
 
-    from django.core.files.uploadedfile import SimpleUploadedFile
-    from PIL import Image
-
     user, profile = user_with_profile
     profile.avatar_url = "https://s3.amazonaws.com/bucket/old-avatar.jpg"
     profile.save()
 
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user
-
-    # Create a valid image file
-    img = Image.new("RGB", (100, 100), color="green")
-    img_file = io.BytesIO()
-    img.save(img_file, format="JPEG")
-    img_file.seek(0)
-    avatar_file = SimpleUploadedFile(
-        "new-avatar.jpg", img_file.read(), content_type="image/jpeg"
-    )
+    request = make_request("patch", user)
+
+    avatar_file = avatar_upload("new-avatar.jpg")
 
     data = {"new_avatar": avatar_file}
 
@@ -537,12 +490,10 @@ def test_profile_update_serializer_avatar_upload_failure(user_with_profile):
         assert "Failed to upload avatar" in str(exc_info.value)
 
 
-def test_profile_update_serializer_invalid_username(user_with_profile):
+def test_profile_update_serializer_invalid_username(user_with_profile, make_request):
     """Test that invalid usernames are rejected in update."""
     user, profile = user_with_profile
-    rf = RequestFactory()
-    request = rf.patch("/")
-    request.user = user
+    request = make_request("patch", user)
 
     data = {"username": "invalid@username!"}
 
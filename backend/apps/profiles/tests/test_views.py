@@ -55,6 +55,121 @@ def test_retrieve_profile_authenticated(client, profile_factory):
     assert data["profile_id"] == profile.profile_id
 
 
+def test_retrieve_profile_listing_counts(client, profile_factory):
+    """Test that retrieve reports active listing and sold item counts."""
+    from apps.listings.models import Listing
+
+    c, u1 = client
+    profile = profile_factory(u1)
+    Listing.objects.bulk_create(
+        [
+            Listing(
+                user=u1,
+                title=f"Item {i}",
+                description="Test",
+                price=10.00,
+                category="books",
+                status=status,
+            )
+            for i, status in enumerate(["active", "active", "sold", "pending"])
+        ]
+    )
+
+    res = c.get(f"/api/v1/profiles/{profile.profile_id}/")
+    assert res.status_code == 200
+    data = res.json()
+    assert data["active_listings"] == 2
+    assert data["sold_items"] == 1
+
+
+def test_list_profiles_query_count(
+    client, profile_factory, nyu_user_factory, django_assert_num_queries
+):
+    """Test that listing profiles takes the same queries however many there are."""
+    c, u1 = client
+    profile_factory(u1)
+    for i in range(2, 6):
+        profile_factory(nyu_user_factory(i))
+
+    # One aggregate for the ETag, one for the page
+    with django_assert_num_queries(2):
+        res = c.get("/api/v1/profiles/")
+    assert res.status_code == 200
+    assert len(res.json()) == 5
+
+
+def test_list_profiles_not_modified_until_profiles_change(
+    client, profile_factory, nyu_user_factory
+):
+    """Test that the list answers 304 until a profile is updated or deleted."""
+    c, u1 = client
+    profile = profile_factory(u1)
+    other = profile_factory(nyu_user_factory(2))
+
+    res = c.get("/api/v1/profiles/")
+    assert res.status_code == 200
+    etag = res["ETag"]
+
+    res = c.get("/api/v1/profiles/", HTTP_IF_NONE_MATCH=etag)
+    assert res.status_code == 304
+
+    profile.bio = "Changed"
+    profile.save()
+    res = c.get("/api/v1/profiles/", HTTP_IF_NONE_MATCH=etag)
+    assert res.status_code == 200
+    etag = res["ETag"]
+
+    other.delete()
+    res = c.get("/api/v1/profiles/", HTTP_IF_NONE_MATCH=etag)
+    assert res.status_code == 200
+    assert len(res.json()) == 1
+
+
+def test_list_profiles_etag_changes_when_user_email_changes(client, profile_factory):
+    """Test that a change to a listed user field invalidates the list ETag."""
+    c, u1 = client
+    profile_factory(u1)
+
+    res = c.get("/api/v1/profiles/")
+    assert res.status_code == 200
+    etag = res["ETag"]
+
+    u1.email = "renamed@nyu.edu"
+    u1.save()
+    res = c.get("/api/v1/profiles/", HTTP_IF_NONE_MATCH=etag)
+    assert res.status_code == 200
+    assert res.json()[0]["email"] == "renamed@nyu.edu"
+
+
+def test_retrieve_profile_query_count(
+    client, profile_factory, django_assert_num_queries
+):
+    """Test that retrieve needs the profile query plus the two rating queries."""
+    c, u1 = client
+    profile = profile_factory(u1)
+
+    with django_assert_num_queries(3):
+        res = c.get(f"/api/v1/profiles/{profile.profile_id}/")
+    assert res.status_code == 200
+
+
+def test_get_queryset_is_built_once_per_request():
+    """Test that get_queryset reuses its built queryset but returns clones."""
+    from unittest.mock import patch
+
+    from apps.profiles.views import ProfileViewSet
+
+    view = ProfileViewSet(action="list")
+    with patch.object(
+        ProfileViewSet, "_build_queryset", return_value=Profile.objects.all()
+    ) as build:
+        first = view.get_queryset()
+        second = view.get_queryset()
+
+    build.assert_called_once()
+    assert first is not second
+
+
 def test_create_profile_success(client):
     """Test creating a profile with valid data."""
     c, u1 = client
@@ -1,14 +1,22 @@
-from django_filters.rest_framework import DjangoFilterBackend
+import logging
+
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from rest_framework import filters, mixins, status, viewsets
-from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import (
     SAFE_METHODS,
     BasePermission,
     IsAuthenticated,
 )
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 
-from utils.s3_service import s3_service
+from utils.fast_json import ORJSONParser, ORJSONRenderer
+from utils.filters import LazyDjangoFilterBackend
+from utils.s3_service import delete_images_in_background
 
 from .models import Profile
 from .serializers import (
@@ -18,6 +26,30 @@ from .serializers import (
     ProfileUpdateSerializer,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def profile_list_etag(request, *args, **kwargs):
+    """ETag for the profile list, from the profile count and latest updates.
+
+    The list shows the user's email next to the profile fields, so the
+    latest user update counts as well as the latest profile update. The
+    count makes deletions change the tag too, which a Last-Modified date
+    based only on updated_at would miss. QuerySet.update() skips auto_now,
+    so bulk writes to either table must set updated_at themselves.
+    """
+    stats = Profile.objects.aggregate(
+        count=Count("profile_id"),
+        profile_updated=Max("updated_at"),
+        user_updated=Max("user__updated_at"),
+    )
+    if stats["profile_updated"] is None:
+        return None
+    return (
+        f"{stats['count']}-{stats['profile_updated'].timestamp()}"
+        f"-{stats['user_updated'].timestamp()}"
+    )
+
 
 # Custom permission class
 class IsOwnerOrReadOnly(BasePermission):
@@ -31,7 +63,7 @@ class IsOwnerOrReadOnly(BasePermission):
             return True
 
         # Write permissions (PUT, PATCH, DELETE) only allowed to the owner
-        return obj.user == request.user
+        return obj.user_id == request.user.id
 
 
 class ProfileViewSet(
@@ -53,11 +85,12 @@ class ProfileViewSet(
 
     queryset = Profile.objects.all()
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     # Filtering and searching
     filter_backends = [
-        DjangoFilterBackend,
+        LazyDjangoFilterBackend,
         filters.OrderingFilter,
         filters.SearchFilter,
     ]
@@ -66,23 +99,62 @@ class ProfileViewSet(
     ordering = ["-created_at"]
     search_fields = ["full_name", "username", "dorm_location"]
 
+    # Per-request cache; DRF builds a new viewset instance for every request
+    _qs_cache = None
+
     def get_queryset(self):
-        """Optimize queryset with select_related to avoid N+1 queries"""
-        queryset = super().get_queryset()
-        queryset = queryset.select_related("user").prefetch_related("user__listings")
+        """Return the action's queryset, building it once per request"""
+        if self._qs_cache is None:
+            self._qs_cache = self._build_queryset()
+        # Hand out a fresh clone so no caller sees another's evaluated results
+        return self._qs_cache.all()
+
+    def _build_queryset(self):
+        """Fetch only what each action's serializer reads, avoiding N+1 queries"""
+        queryset = super().get_queryset().select_related("user")
+        if self.action == "list":
+            # CompactProfileSerializer fields only
+            return queryset.only(
+                "profile_id",
+                "full_name",
+                "username",
+                "avatar_url",
+                "dorm_location",
+                "user__email",
+            )
+        if self.action == "retrieve":
+            return queryset.annotate(
+                num_active_listings=Count(
+                    "user__listings", filter=Q(user__listings__status="active")
+                ),
+                num_sold_items=Count(
+                    "user__listings", filter=Q(user__listings__status="sold")
+                ),
+            )
+        # Write actions still read instance.user for ownership checks
         return queryset
 
+    # Serializer per action; anything unlisted gets the detail serializer
+    _SERIALIZER_MAP = {
+        "create": ProfileCreateSerializer,
+        "update": ProfileUpdateSerializer,
+        "partial_update": ProfileUpdateSerializer,
+        "retrieve": ProfileDetailSerializer,
+        "list": CompactProfileSerializer,
+    }
+
     def get_serializer_class(self):
         """Return different serializers for different actions"""
-        if self.action == "create":
-            return ProfileCreateSerializer
-        elif self.action in ["update", "partial_update"]:
-            return ProfileUpdateSerializer
-        elif self.action == "retrieve":
-            return ProfileDetailSerializer
-        elif self.action == "list":
-            return CompactProfileSerializer
-        return ProfileDetailSerializer
+        return self._SERIALIZER_MAP.get(self.action, ProfileDetailSerializer)
+
+    @method_decorator(etag(profile_list_etag))
+    def list(self, request, *args, **kwargs):
+        """
+        List profiles, answering 304 Not Modified when the client's ETag
+        still matches.
+        GET /api/v1/profiles/
+        """
+        return super().list(request, *args, **kwargs)
 
     def retrieve(self, request, *args, **kwargs):
         """
@@ -94,7 +166,7 @@ class ProfileViewSet(
         data = serializer.data
 
         # Add flag to indicate if this is the current user's profile
-        data["is_own_profile"] = instance.user == request.user
+        data["is_own_profile"] = instance.user_id == request.user.id
 
         return Response(data, status=status.HTTP_200_OK)
 
@@ -110,6 +182,7 @@ class ProfileViewSet(
         - All ListingImages (CASCADE via Listings)
         - All Watchlist entries (CASCADE)
         - All Transactions (both as buyer and seller) (CASCADE)
+        - All Reviews and Notifications tied to the above (CASCADE)
         - All ConversationParticipants (CASCADE)
         - All Messages will have sender set to None (handled by model)
 
@@ -119,32 +192,63 @@ class ProfileViewSet(
         """
         user = instance.user
 
-        # Delete profile avatar from S3 if exists
-        if instance.avatar_url:
-            try:
-                s3_service.delete_image(instance.avatar_url)
-            except Exception as e:
-                # Log but don't fail deletion if S3 delete fails
-                print(f"Warning: Failed to delete avatar from S3: {str(e)}")
-
-        # Delete all listing images from S3
+        # Collect every S3 object to remove: the avatar and all listing images
+        image_urls = [instance.avatar_url] if instance.avatar_url else []
         try:
             from apps.listings.models import ListingImage
 
-            # Get all listing IDs for this user first
-            user_listing_ids = list(user.listings.values_list("listing_id", flat=True))
-            if user_listing_ids:
-                listing_images = ListingImage.objects.filter(
-                    listing_id__in=user_listing_ids
-                )
-                for img in listing_images:
-                    try:
-                        s3_service.delete_image(img.image_url)
-                    except Exception as e:
-                        msg = "Warning: Failed to delete listing image"
-                        print(f"{msg} from S3: {str(e)}")
-        except Exception as e:
-            print(f"Warning: Error during listing images cleanup: {str(e)}")
-
-        # Delete the user (cascades to profile and all related data)
-        user.delete()
+            # One JOIN query for the URLs of every image on the user's listings
+            image_urls += ListingImage.objects.filter(
+                listing__user_id=user.id
+            ).values_list("image_url", flat=True)
+        except Exception:
+            logger.warning("Error collecting listing images for cleanup", exc_info=True)
+
+        with transaction.atomic():
+            self._bulk_delete_user_data(user)
+            # Only the few remaining rows (admin log, group and permission
+            # links) are left for Django's collector to gather here.
+            user.delete()
+
+            # Delete the images from S3 in batched requests once the account
+            # deletion has committed, on a worker thread so the response need
+            # not wait. Registered inside the atomic block so a rollback
+            # discards it; outside one, on_commit would run it immediately.
+            if image_urls:
+                transaction.on_commit(lambda: delete_images_in_background(image_urls))
+
+    @staticmethod
+    def _bulk_delete_user_data(user):
+        """Remove the user's dependent rows with raw DELETE/UPDATE statements.
+
+        ``Model.delete()`` loads every cascaded row into memory before
+        deleting it. None of these models rely on delete signals, so we issue
+        set-based statements in FK dependency order instead.
+        """
+        from apps.chat.models import Conversation, ConversationParticipant, Message
+        from apps.listings.models import Listing, ListingImage, Watchlist
+        from apps.notifications.models import Notification
+        from apps.transactions.models import Review, Transaction
+
+        using = user._state.db
+        listings = Listing.objects.filter(user=user).values("listing_id")
+        transactions = Transaction.objects.filter(
+            Q(buyer=user) | Q(seller=user) | Q(listing_id__in=listings)
+        )
+
+        Notification.objects.filter(
+            Q(recipient=user) | Q(actor=user) | Q(listing_id__in=listings)
+        )._raw_delete(using)
+        Review.objects.filter(
+            Q(reviewer=user) | Q(transaction_id__in=transactions.values("pk"))
+        )._raw_delete(using)
+        transactions._raw_delete(using)
+        Watchlist.objects.filter(Q(user=user) | Q(listing_id__in=listings))._raw_delete(
+            using
+        )
+        ListingImage.objects.filter(listing_id__in=listings)._raw_delete(using)
+        Listing.objects.filter(user=user)._raw_delete(using)
+        ConversationParticipant.objects.filter(user=user)._raw_delete(using)
+        Message.objects.filter(sender=user).update(sender=None)
+        Conversation.objects.filter(created_by=user).update(created_by=None)
+        Profile.objects.filter(user=user)._raw_delete(using)
@@ -34,15 +34,15 @@ def create_system_message(transaction, text):
             defaults={"created_by": buyer},
         )
 
-        # Ensure both participants exist
-        have = set(
-            ConversationParticipant.objects.filter(conversation=conv).values_list(
-                "user_id", flat=True
-            )
+        # Ensure both participants exist; the unique (conversation, user)
+        # constraint lets the database skip the ones already there
+        ConversationParticipant.objects.bulk_create(
+            [
+                ConversationParticipant(conversation=conv, user_id=buyer.id),
+                ConversationParticipant(conversation=conv, user_id=seller.id),
+            ],
+            ignore_conflicts=True,
         )
-        need = {buyer.id, seller.id} - have
-        for uid in need:
-            ConversationParticipant.objects.create(conversation=conv, user_id=uid)
 
         # Create system message
         # Use buyer as sender (system messages are from the platform,
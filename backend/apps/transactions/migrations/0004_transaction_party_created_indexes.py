@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-16 04:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("listings", "0008_listing_is_deleted"),
+        ("transactions", "0003_merge_0002_review_0002_transaction_proposed_by"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["buyer", "-created_at"], name="transaction_buyer_i_12ad93_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["seller", "-created_at"], name="transaction_seller__07be88_idx"
+            ),
+        ),
+    ]
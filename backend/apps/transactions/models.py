@@ -63,6 +63,9 @@ class Transaction(models.Model):
             models.Index(fields=["seller"]),
             models.Index(fields=["listing"]),
             models.Index(fields=["status"]),
+            # My Orders lists each side of a user's transactions newest first
+            models.Index(fields=["buyer", "-created_at"]),
+            models.Index(fields=["seller", "-created_at"]),
         ]
         ordering = ["-created_at"]
 
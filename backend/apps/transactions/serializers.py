@@ -2,6 +2,12 @@ from rest_framework import serializers
 
 from .models import Review, Transaction
 
+# Accepted what_went_well values, and the list shown in the error message
+_WHAT_WENT_WELL_CHOICES = frozenset(value for value, _ in Review.WHAT_WENT_WELL_CHOICES)
+_WHAT_WENT_WELL_CHOICES_TEXT = ", ".join(
+    value for value, _ in Review.WHAT_WENT_WELL_CHOICES
+)
+
 
 class ReviewSerializer(serializers.ModelSerializer):
     """Serializer for Review model - used for read operations"""
@@ -34,12 +40,7 @@ class ReviewSerializer(serializers.ModelSerializer):
 class ReviewCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating a review"""
 
-    VALID_WHAT_WENT_WELL_CHOICES = [
-        "punctuality",
-        "communication",
-        "pricing",
-        "item_description",
-    ]
+    VALID_WHAT_WENT_WELL_CHOICES = _WHAT_WENT_WELL_CHOICES
 
     class Meta:
         model = Review
@@ -61,10 +62,14 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("what_went_well must be a list.")
 
         for item in value:
-            if item not in self.VALID_WHAT_WENT_WELL_CHOICES:
-                choices = ", ".join(self.VALID_WHAT_WENT_WELL_CHOICES)
+            # JSON objects and arrays are unhashable, so check the type first
+            if (
+                not isinstance(item, str)
+                or item not in self.VALID_WHAT_WENT_WELL_CHOICES
+            ):
                 raise serializers.ValidationError(
-                    f"'{item}' is not a valid choice. Choose from: {choices}"
+                    f"'{item}' is not a valid choice. "
+                    f"Choose from: {_WHAT_WENT_WELL_CHOICES_TEXT}"
                 )
 
         return value
@@ -73,12 +78,7 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
 class ReviewUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating a review"""
 
-    VALID_WHAT_WENT_WELL_CHOICES = [
-        "punctuality",
-        "communication",
-        "pricing",
-        "item_description",
-    ]
+    VALID_WHAT_WENT_WELL_CHOICES = _WHAT_WENT_WELL_CHOICES
 
     class Meta:
         model = Review
@@ -100,10 +100,14 @@ class ReviewUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("what_went_well must be a list.")
 
         for item in value:
-            if item not in self.VALID_WHAT_WENT_WELL_CHOICES:
-                choices = ", ".join(self.VALID_WHAT_WENT_WELL_CHOICES)
+            # JSON objects and arrays are unhashable, so check the type first
+            if (
+                not isinstance(item, str)
+                or item not in self.VALID_WHAT_WENT_WELL_CHOICES
+            ):
                 raise serializers.ValidationError(
-                    f"'{item}' is not a valid choice. Choose from: {choices}"
+                    f"'{item}' is not a valid choice. "
+                    f"Choose from: {_WHAT_WENT_WELL_CHOICES_TEXT}"
                 )
 
         return value
@@ -124,8 +128,8 @@ class TransactionSerializer(serializers.ModelSerializer):
     )
     listing_image_url = serializers.SerializerMethodField()
     listing_thumbnail_url = serializers.SerializerMethodField()
-    buyer_id = serializers.IntegerField(source="buyer.id", read_only=True)
-    seller_id = serializers.IntegerField(source="seller.id", read_only=True)
+    buyer_id = serializers.IntegerField(read_only=True)
+    seller_id = serializers.IntegerField(read_only=True)
     review = ReviewSerializer(read_only=True)
 
     class Meta:
@@ -176,6 +180,10 @@ class TransactionSerializer(serializers.ModelSerializer):
         """
         Return 'buyer' or 'seller' dependsing on the authenticated user.
         """
+        # TransactionViewSet annotates the role in SQL
+        if hasattr(obj, "viewer_role"):
+            return obj.viewer_role
+
         request = self.context.get("request")
         user = getattr(request, "user", None)
 
@@ -200,13 +208,15 @@ class TransactionSerializer(serializers.ModelSerializer):
         if not listing:
             return None
 
-        primary_img = listing.images.filter(is_primary=True).first()
+        # Pick from .all() so a prefetched listing__images is reused instead
+        # of querying per row; images are ordered by display_order
+        images = list(listing.images.all())
+        primary_img = next((img for img in images if img.is_primary), None)
         if primary_img:
             return primary_img.image_url
 
-        first_img = listing.images.order_by("display_order").first()
-        if first_img:
-            return first_img.image_url
+        if images:
+            return images[0].image_url
 
         return None
 
@@ -223,17 +233,29 @@ class PaymentMethodUpdateSerializer(serializers.Serializer):
 
     payment_method = serializers.ChoiceField(choices=Transaction.PAYMENT_METHOD_CHOICES)
 
-    def validate_payment_method(self, value):
-        if value not in ["venmo", "zelle", "cash"]:
-            raise serializers.ValidationError(
-                "Payment method must be one of: venmo, zelle, cash"
-            )
-        return value
+
+def _validate_meetup(data):
+    """Meetups need both a place and a time"""
+    if not data.get("meet_location"):
+        raise serializers.ValidationError(
+            "meet_location is required for meetup delivery method"
+        )
+    if not data.get("meet_time"):
+        raise serializers.ValidationError(
+            "meet_time is required for meetup delivery method"
+        )
 
 
 class DeliveryDetailsUpdateSerializer(serializers.Serializer):
     """Serializer for updating delivery details"""
 
+    # Extra checks per delivery method; for pickup, meet_location and
+    # meet_time are optional
+    _VALIDATORS = {
+        "meetup": _validate_meetup,
+        "pickup": lambda data: None,
+    }
+
     delivery_method = serializers.ChoiceField(
         choices=Transaction.DELIVERY_METHOD_CHOICES
     )
@@ -243,21 +265,5 @@ class DeliveryDetailsUpdateSerializer(serializers.Serializer):
     meet_time = serializers.DateTimeField(required=False, allow_null=True)
 
     def validate(self, data):
-        delivery_method = data.get("delivery_method")
-        meet_location = data.get("meet_location")
-        meet_time = data.get("meet_time")
-
-        if delivery_method == "meetup":
-            if not meet_location:
-                raise serializers.ValidationError(
-                    "meet_location is required for meetup delivery method"
-                )
-            if not meet_time:
-                raise serializers.ValidationError(
-                    "meet_time is required for meetup delivery method"
-                )
-        elif delivery_method == "pickup":
-            # For pickup, meet_location and meet_time are optional
-            pass
-
+        self._VALIDATORS[data["delivery_method"]](data)
         return data
@@ -0,0 +1,89 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+
+@pytest.fixture(scope="session")
+def _session_api_client():
+    """Single APIClient shared by every transactions test."""
+    return APIClient()
+
+
+@pytest.fixture
+def api_client(_session_api_client):
+    """Shared APIClient, logged out again after each test."""
+    yield _session_api_client
+    _session_api_client.logout()
+
+
+@pytest.fixture(scope="session")
+def api_rf():
+    """Single APIRequestFactory shared by every transactions test."""
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def call_view(api_rf):
+    """Call a DRF view directly, skipping URL routing and middleware.
+
+    For tests that only check the status code and response data; keep at
+    least one APIClient test per endpoint so the URL config stays covered.
+    """
+
+    def _call(view, method, url, user=None, data=None, **view_kwargs):
+        request = getattr(api_rf, method)(url, data, format="json")
+        if user is not None:
+            force_authenticate(request, user=user)
+        return view(request, **view_kwargs)
+
+    return _call
+
+
+@pytest.fixture(scope="module")
+def module_db(django_db_setup, django_db_blocker):
+    """Outer transaction for rows shared by a whole test module.
+
+    Rows created under it stay visible to every test in the module, and
+    each test's own savepoint undoes whatever that test changes. The
+    transaction is rolled back once the module finishes.
+    """
+    with django_db_blocker.unblock():
+        with transaction.atomic():
+            yield
+            transaction.set_rollback(True)
+
+
+@pytest.fixture(scope="module")
+def make_module_users(module_db):
+    """Create verified users once per module and return their ids."""
+
+    def _make(*emails):
+        User = get_user_model()
+        # Hash the shared password once and insert every user in one query;
+        # nothing listens for User saves, so skipping save() is safe
+        password = make_password("testpass123")
+        User.objects.bulk_create(
+            [
+                User(email=email, password=password, is_email_verified=True)
+                for email in emails
+            ]
+        )
+        # bulk_create only sets primary keys on backends that support
+        # RETURNING (not MySQL), so look the ids up by email
+        ids = dict(User.objects.filter(email__in=emails).values_list("email", "pk"))
+        return [ids[email] for email in emails]
+
+    return _make
+
+
+@pytest.fixture
+def fetch_users(db, django_user_model):
+    """Load fresh User instances for a list of ids, in order, in one query."""
+
+    def _fetch(ids):
+        users = django_user_model.objects.in_bulk(ids)
+        return tuple(users[pk] for pk in ids)
+
+    return _fetch
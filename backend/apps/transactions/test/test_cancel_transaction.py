@@ -1,50 +1,50 @@
 # apps/transactions/test/test_cancel_transaction.py
 
 import pytest
-from django.contrib.auth import get_user_model
 from rest_framework import status
-from rest_framework.test import APIClient
 
 from apps.listings.models import Listing
 from apps.transactions.models import Transaction
+from apps.transactions.views import TransactionUpdateViewSet
 
-User = get_user_model()
+
+@pytest.fixture(scope="module")
+def _two_user_ids(make_module_users):
+    return make_module_users("buyer-cancel@nyu.edu", "seller-cancel@nyu.edu")
 
 
 @pytest.fixture
-def api_client():
-    return APIClient()
+def two_users(_two_user_ids, fetch_users):
+    """A buyer and seller, created once for the module"""
+    return fetch_users(_two_user_ids)
 
 
 @pytest.fixture
-def two_users(db):
-    """Create a buyer and seller"""
-    buyer = User.objects.create_user(
-        email="buyer-cancel@nyu.edu",
-        password="testpass123",
-        is_email_verified=True,
-    )
-    seller = User.objects.create_user(
-        email="seller-cancel@nyu.edu",
-        password="testpass123",
-        is_email_verified=True,
-    )
-    return buyer, seller
+def buyer_client(api_client, two_users):
+    """The shared APIClient, authenticated as the buyer"""
+    api_client.force_authenticate(user=two_users[0])
+    return api_client
 
 
-@pytest.fixture
-def listing(two_users):
-    """Create a listing owned by the seller"""
-    _, seller = two_users
+@pytest.fixture(scope="module")
+def _listing_id(module_db, _two_user_ids):
+    """Create a listing owned by the seller, once for the module"""
+    _, seller_id = _two_user_ids
     return Listing.objects.create(
-        user=seller,
+        user_id=seller_id,
         category="Textbooks",
         title="CS-GY 6063 Notes",
         description="Almost new, barely used.",
         price="25.00",
         status="pending",  # Currently in a transaction
         dorm_location="Tandon",
-    )
+    ).pk
+
+
+@pytest.fixture
+def listing(_listing_id, db):
+    """Fresh instance of the module's listing; per-test changes roll back"""
+    return Listing.objects.get(pk=_listing_id)
 
 
 @pytest.fixture
@@ -73,20 +73,30 @@ def _cancel_url(tx_id: int) -> str:
     return f"/api/v1/transactions/{tx_id}/cancel/"
 
 
+_cancel_view = TransactionUpdateViewSet.as_view({"patch": "cancel"})
+
+
+def _cancel(call_view, tx, user):
+    """PATCH the cancel action directly, without routing or middleware"""
+    return call_view(
+        _cancel_view,
+        "patch",
+        _cancel_url(tx.transaction_id),
+        user=user,
+        pk=tx.transaction_id,
+    )
+
+
 @pytest.mark.django_db
-def test_buyer_can_cancel_pending_transaction(
-    api_client, two_users, make_transaction, listing
-):
-    buyer, seller = two_users
+def test_buyer_can_cancel_pending_transaction(buyer_client, make_transaction, listing):
     tx = make_transaction(status="PENDING")
 
-    api_client.force_authenticate(user=buyer)
-
-    resp = api_client.patch(_cancel_url(tx.transaction_id))
+    resp = buyer_client.patch(_cancel_url(tx.transaction_id))
     assert resp.status_code == status.HTTP_200_OK
 
-    tx.refresh_from_db()
-    listing.refresh_from_db()
+    # One joined SELECT instead of refreshing each row separately
+    tx = Transaction.objects.select_related("listing").get(pk=tx.transaction_id)
+    listing = tx.listing
 
     # Transaction status becomes CANCELLED
     assert tx.status == "CANCELLED"
@@ -98,7 +108,7 @@ def test_buyer_can_cancel_pending_transaction(
 
 @pytest.mark.django_db
 def test_seller_can_cancel_scheduled_transaction(
-    api_client, two_users, make_transaction, listing
+    call_view, two_users, make_transaction, listing
 ):
     buyer, seller = two_users
     # Assume negotiation is done and status is SCHEDULED
@@ -108,75 +118,54 @@ def test_seller_can_cancel_scheduled_transaction(
     listing.status = "sold"
     listing.save()
 
-    api_client.force_authenticate(user=seller)
-
-    resp = api_client.patch(_cancel_url(tx.transaction_id))
+    resp = _cancel(call_view, tx, seller)
     assert resp.status_code == status.HTTP_200_OK
 
-    tx.refresh_from_db()
-    listing.refresh_from_db()
+    tx = Transaction.objects.select_related("listing").get(pk=tx.transaction_id)
+    listing = tx.listing
 
     assert tx.status == "CANCELLED"
     assert listing.status == "active"
 
 
-@pytest.mark.django_db
-def test_cannot_cancel_completed_transaction(api_client, two_users, make_transaction):
-    buyer, seller = two_users
-    tx = make_transaction(status="COMPLETED")
-
-    api_client.force_authenticate(user=buyer)
-
-    resp = api_client.patch(_cancel_url(tx.transaction_id))
-    assert resp.status_code == status.HTTP_400_BAD_REQUEST
-    assert "cannot be cancelled" in resp.data.get("error", "").lower()
-
-    tx.refresh_from_db()
-    assert tx.status == "COMPLETED"
-
-
-@pytest.mark.django_db
-def test_cannot_cancel_twice(api_client, two_users, make_transaction):
-    buyer, seller = two_users
-    tx = make_transaction(status="PENDING")
-
-    api_client.force_authenticate(user=buyer)
-
-    # First cancel succeeds
-    resp1 = api_client.patch(_cancel_url(tx.transaction_id))
-    assert resp1.status_code == status.HTTP_200_OK
-
-    tx.refresh_from_db()
-    assert tx.status == "CANCELLED"
-
-    # Second cancel -> 400
-    resp2 = api_client.patch(_cancel_url(tx.transaction_id))
-    assert resp2.status_code == status.HTTP_400_BAD_REQUEST
-    assert "already cancelled" in resp2.data.get("error", "").lower()
-
-    tx.refresh_from_db()
-    assert tx.status == "CANCELLED"
-
-
-@pytest.mark.django_db
-def test_third_party_cannot_cancel(
-    api_client, two_users, make_transaction, django_user_model
-):
-    buyer, seller = two_users
-    tx = make_transaction(status="PENDING")
-
-    # Create a user who is neither buyer nor seller
-    stranger = django_user_model.objects.create_user(
+@pytest.fixture
+def stranger(django_user_model):
+    """A user who is neither buyer nor seller"""
+    return django_user_model.objects.create_user(
         email="stranger@nyu.edu",
         password="testpass123",
         is_email_verified=True,
     )
 
-    api_client.force_authenticate(user=stranger)
 
-    resp = api_client.patch(_cancel_url(tx.transaction_id))
-    assert resp.status_code == status.HTTP_403_FORBIDDEN
-    assert "only the buyer or seller" in resp.data.get("error", "").lower()
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "initial_status,actor,expected_status,expected_msg",
+    [
+        ("COMPLETED", "buyer", status.HTTP_400_BAD_REQUEST, "cannot be cancelled"),
+        ("CANCELLED", "buyer", status.HTTP_400_BAD_REQUEST, "already cancelled"),
+        ("PENDING", "stranger", status.HTTP_403_FORBIDDEN, "only the buyer or seller"),
+    ],
+    ids=["completed", "already-cancelled", "third-party"],
+)
+def test_cancel_is_rejected(
+    request,
+    call_view,
+    two_users,
+    make_transaction,
+    initial_status,
+    actor,
+    expected_status,
+    expected_msg,
+):
+    buyer, seller = two_users
+    tx = make_transaction(status=initial_status)
+    # Only the third-party case needs the extra user
+    user = buyer if actor == "buyer" else request.getfixturevalue("stranger")
+
+    resp = _cancel(call_view, tx, user)
+    assert resp.status_code == expected_status
+    assert expected_msg in resp.data.get("error", "").lower()
 
     tx.refresh_from_db()
-    assert tx.status == "PENDING"
+    assert tx.status == initial_status
@@ -1,45 +1,27 @@
 import pytest
 from decimal import Decimal
 
-from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
 
-from apps.listings.models import Listing
+from apps.listings.models import Listing, ListingImage
 from apps.transactions.models import Transaction
 
-User = get_user_model()
 
-
-@pytest.fixture
-def api_client():
-    return APIClient()
+@pytest.fixture(scope="module")
+def _user_ids(make_module_users):
+    return make_module_users("buyer@nyu.edu", "seller@nyu.edu", "stranger@nyu.edu")
 
 
 @pytest.fixture
-def users(db):
+def users(_user_ids, fetch_users):
     """
-    Create three users:
+    Three users, created once for the module:
     - buyer: used for my-orders tests
     - seller: acts as the listing/transaction seller
     - stranger: unrelated to these transactions
     """
-    buyer = User.objects.create_user(
-        email="buyer@nyu.edu",
-        password="testpass123",
-        is_email_verified=True,
-    )
-    seller = User.objects.create_user(
-        email="seller@nyu.edu",
-        password="testpass123",
-        is_email_verified=True,
-    )
-    stranger = User.objects.create_user(
-        email="stranger@nyu.edu",
-        password="testpass123",
-        is_email_verified=True,
-    )
-    return buyer, seller, stranger
+    return fetch_users(_user_ids)
 
 
 @pytest.fixture
@@ -67,28 +49,36 @@ def transactions(users, listing):
     """
     buyer, seller, stranger = users
 
-    t1 = Transaction.objects.create(
-        listing=listing,
-        buyer=buyer,
-        seller=seller,
-        status="INITIATED",
-    )
-    t2 = Transaction.objects.create(
-        listing=listing,
-        buyer=buyer,
-        seller=seller,
-        status="COMPLETED",
-    )
-    t3 = Transaction.objects.create(
-        listing=listing,
-        buyer=stranger,
-        seller=seller,
-        status="NEGOTIATING",
+    # One INSERT for all three
+    Transaction.objects.bulk_create(
+        [
+            Transaction(
+                listing=listing,
+                buyer=buyer,
+                seller=seller,
+                status="INITIATED",
+            ),
+            Transaction(
+                listing=listing,
+                buyer=buyer,
+                seller=seller,
+                status="COMPLETED",
+            ),
+            Transaction(
+                listing=listing,
+                buyer=stranger,
+                seller=seller,
+                status="NEGOTIATING",
+            ),
+        ]
     )
+    # bulk_create leaves primary keys unset on backends without RETURNING
+    # (MySQL), so read the rows back; the listing is unique to this test
+    t1, t2, t3 = Transaction.objects.filter(listing=listing).order_by("pk")
     return t1, t2, t3
 
 
-def auth_client(client: APIClient, user: User) -> APIClient:
+def auth_client(client: APIClient, user) -> APIClient:
     """
     Helper: use force_authenticate to log the client in as a user.
     """
@@ -103,17 +93,18 @@ def auth_client(client: APIClient, user: User) -> APIClient:
 
 @pytest.mark.django_db
 def test_my_orders_returns_only_transactions_for_current_user(
-    api_client, users, transactions
+    api_client, users, transactions, django_assert_max_num_queries
 ):
     buyer, seller, stranger = users
     t1, t2, t3 = transactions
 
     client = auth_client(api_client, buyer)
 
-    resp = client.get("/api/v1/transactions/my-orders/")
+    with django_assert_max_num_queries(3):
+        resp = client.get("/api/v1/transactions/my-orders/")
     assert resp.status_code == status.HTTP_200_OK
 
-    data = resp.json()
+    data = resp.data
     # Pagination is off → response should be a list
     assert isinstance(data, list)
 
@@ -127,16 +118,19 @@ def test_my_orders_returns_only_transactions_for_current_user(
 
 
 @pytest.mark.django_db
-def test_my_orders_for_seller_shows_seller_viewer_role(api_client, users, transactions):
+def test_my_orders_for_seller_shows_seller_viewer_role(
+    api_client, users, transactions, django_assert_max_num_queries
+):
     buyer, seller, stranger = users
     t1, t2, t3 = transactions
 
     client = auth_client(api_client, seller)
 
-    resp = client.get("/api/v1/transactions/my-orders/")
+    with django_assert_max_num_queries(3):
+        resp = client.get("/api/v1/transactions/my-orders/")
     assert resp.status_code == status.HTTP_200_OK
 
-    data = resp.json()
+    data = resp.data
     assert isinstance(data, list)
 
     returned_ids = {item["transaction_id"] for item in data}
@@ -148,8 +142,40 @@ def test_my_orders_for_seller_shows_seller_viewer_role(api_client, users, transa
 
 
 @pytest.mark.django_db
-def test_my_orders_requires_authentication(api_client):
-    resp = api_client.get("/api/v1/transactions/my-orders/")
+def test_my_orders_query_count_does_not_grow_with_rows(
+    api_client, users, listing, transactions, django_assert_num_queries
+):
+    buyer, seller, stranger = users
+    ListingImage.objects.bulk_create(
+        [
+            ListingImage(listing=listing, image_url="first.jpg", display_order=0),
+            ListingImage(
+                listing=listing,
+                image_url="primary.jpg",
+                display_order=1,
+                is_primary=True,
+            ),
+        ]
+    )
+
+    client = auth_client(api_client, seller)
+
+    # Transactions (with listing, buyer and review joined) + listing images
+    with django_assert_num_queries(2):
+        resp = client.get("/api/v1/transactions/my-orders/")
+
+    assert resp.status_code == status.HTTP_200_OK
+    data = resp.data
+    assert len(data) == 3
+    assert {item["listing_image_url"] for item in data} == {"primary.jpg"}
+    assert {item["buyer_id"] for item in data} == {buyer.id, stranger.id}
+    assert {item["seller_id"] for item in data} == {seller.id}
+
+
+def test_my_orders_requires_authentication():
+    # No django_db mark: the request is rejected before any query. A fresh
+    # client is used because the shared one's logout() touches the session table
+    resp = APIClient().get("/api/v1/transactions/my-orders/")
     # DRF defaults to 401 Unauthorized when not logged in
     assert resp.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
     # With IsAuthenticated it will be 401; Session without login may be 403
@@ -161,16 +187,19 @@ def test_my_orders_requires_authentication(api_client):
 
 
 @pytest.mark.django_db
-def test_transactions_list_is_filtered_to_current_user(api_client, users, transactions):
+def test_transactions_list_is_filtered_to_current_user(
+    api_client, users, transactions, django_assert_max_num_queries
+):
     buyer, seller, stranger = users
     t1, t2, t3 = transactions
 
     client = auth_client(api_client, buyer)
 
-    resp = client.get("/api/v1/transactions/")
+    with django_assert_max_num_queries(3):
+        resp = client.get("/api/v1/transactions/")
     assert resp.status_code == status.HTTP_200_OK
 
-    data = resp.json()
+    data = resp.data
     assert isinstance(data, list)
 
     returned_ids = {item["transaction_id"] for item in data}
@@ -186,24 +215,25 @@ def test_transactions_list_is_filtered_to_current_user(api_client, users, transa
 
 @pytest.mark.django_db
 def test_transaction_detail_only_visible_to_participants(
-    api_client, users, transactions
+    api_client, users, transactions, django_assert_max_num_queries
 ):
     buyer, seller, stranger = users
     t1, t2, t3 = transactions
 
-    # Buyer can view their own transaction
-    client_buyer = auth_client(APIClient(), buyer)
-    resp = client_buyer.get(f"/api/v1/transactions/{t1.transaction_id}/")
+    # Buyer can view their own transaction: the joined row + listing images
+    client = auth_client(api_client, buyer)
+    with django_assert_max_num_queries(2):
+        resp = client.get(f"/api/v1/transactions/{t1.transaction_id}/")
     assert resp.status_code == status.HTTP_200_OK
-    assert resp.json()["transaction_id"] == t1.transaction_id
+    assert resp.data["transaction_id"] == t1.transaction_id
 
     # Seller can also view it
-    client_seller = auth_client(APIClient(), seller)
-    resp = client_seller.get(f"/api/v1/transactions/{t1.transaction_id}/")
+    auth_client(api_client, seller)
+    resp = client.get(f"/api/v1/transactions/{t1.transaction_id}/")
     assert resp.status_code == status.HTTP_200_OK
 
     # Stranger cannot view buyer/seller transactions
     # → expect 403 or 404 depending on permissions
-    client_stranger = auth_client(APIClient(), stranger)
-    resp = client_stranger.get(f"/api/v1/transactions/{t1.transaction_id}/")
+    auth_client(api_client, stranger)
+    resp = client.get(f"/api/v1/transactions/{t1.transaction_id}/")
     assert resp.status_code in (status.HTTP_403_FORBIDDEN, status.HTTP_404_NOT_FOUND)
@@ -1,12 +1,12 @@
 import pytest
 from datetime import timedelta
+from types import SimpleNamespace
 
-from django.contrib.auth import get_user_model
+from django.db import transaction as db_transaction
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APIClient
 
-from apps.chat.models import Conversation, Message
+from apps.chat.models import Conversation, ConversationParticipant, Message
 from apps.listings.models import Listing
 from apps.transactions.helpers import create_system_message
 from apps.transactions.models import Review, Transaction
@@ -23,27 +23,58 @@ from apps.transactions.views import (
     IsBuyerOrSeller,
     IsReviewer,
     IsSeller,
+    TransactionUpdateViewSet,
     TransactionViewSet,
 )
+from tests.factories.factories import TransactionFactory
 
-User = get_user_model()
+# Permission classes are stateless, so every test can share one instance
+IS_BUYER = IsBuyer()
+IS_SELLER = IsSeller()
+IS_BUYER_OR_SELLER = IsBuyerOrSeller()
+IS_REVIEWER = IsReviewer()
+
+
+@pytest.fixture(scope="module")
+def future_meet_time():
+    """One meetup time for every confirm test, two hours after the module starts"""
+    return timezone.now() + timedelta(hours=2)
+
+
+@pytest.fixture(scope="module")
+def _two_user_ids(make_module_users):
+    return make_module_users("buyer@nyu.edu", "seller@nyu.edu")
 
 
 @pytest.fixture
-def api_client():
-    return APIClient()
+def two_users(_two_user_ids, fetch_users):
+    """Two users for testing, created once for the module"""
+    return fetch_users(_two_user_ids)
+
+
+@pytest.fixture(scope="module")
+def _other_user_id(make_module_users):
+    (other_user_id,) = make_module_users("other@nyu.edu")
+    return other_user_id
 
 
 @pytest.fixture
-def two_users(db):
-    """Create two users for testing"""
-    user1 = User.objects.create_user(
-        email="buyer@nyu.edu", password="testpass123", is_email_verified=True
-    )
-    user2 = User.objects.create_user(
-        email="seller@nyu.edu", password="testpass123", is_email_verified=True
-    )
-    return user1, user2
+def other_user(_other_user_id, fetch_users):
+    """A user outside the test transactions, created once for the module"""
+    (user,) = fetch_users([_other_user_id])
+    return user
+
+
+@pytest.fixture
+def buyer(two_users):
+    """The buyer from two_users"""
+    return two_users[0]
+
+
+@pytest.fixture
+def seller(two_users):
+    """The seller from two_users"""
+    return two_users[1]
 
 
 @pytest.fixture
@@ -62,28 +93,54 @@ def authenticated_seller(api_client, two_users):
     return api_client, seller
 
 
-@pytest.fixture
-def listing(two_users, db):
-    """Create a test listing"""
-    _, seller = two_users
-    listing = Listing.objects.create(
-        user=seller,
+@pytest.fixture(scope="module")
+def _listing_id(module_db, _two_user_ids):
+    """Create a test listing once for the module"""
+    _, seller_id = _two_user_ids
+    return Listing.objects.create(
+        user_id=seller_id,
         category="Electronics",
         title="Test Laptop",
         description="A test laptop",
         price=500.00,
         status="active",
-    )
-    return listing
+    ).pk
+
+
+@pytest.fixture
+def listing(_listing_id, db):
+    """Fresh instance of the test listing; per-test changes roll back"""
+    return Listing.objects.get(pk=_listing_id)
 
 
 @pytest.fixture
 def transaction(two_users, listing, db):
     """Create a test transaction"""
     buyer, seller = two_users
-    return Transaction.objects.create(
-        listing=listing, buyer=buyer, seller=seller, status="PENDING"
-    )
+    return TransactionFactory(listing=listing, buyer=buyer, seller=seller)
+
+
+@pytest.fixture(scope="class")
+def _shared_transaction_id(module_db, _two_user_ids, _listing_id):
+    """Insert one test transaction per test class, rolled back afterwards"""
+    buyer_id, seller_id = _two_user_ids
+    with db_transaction.atomic():
+        # Plain create: passing *_id to the factory would not stop its
+        # SubFactories from inserting their own listing and users
+        yield Transaction.objects.create(
+            listing_id=_listing_id, buyer_id=buyer_id, seller_id=seller_id
+        ).transaction_id
+        db_transaction.set_rollback(True)
+
+
+@pytest.fixture
+def shared_transaction(_shared_transaction_id, db):
+    """Like ``transaction``, but the row is shared by the whole class.
+
+    Only for tests that read the transaction; each test's savepoint still
+    undoes any change, but the row stays visible to the rest of the class.
+    """
+    return Transaction.objects.get(pk=_shared_transaction_id)
 
 
 @pytest.mark.django_db
@@ -101,10 +158,10 @@ class TestTransactionModel:
         assert transaction.seller == seller
         assert transaction.status == "PENDING"
 
-    def test_transaction_str_representation(self, transaction):
+    def test_transaction_str_representation(self, shared_transaction):
         """Test transaction string representation"""
-        assert "Transaction" in str(transaction)
-        assert str(transaction.listing.title) in str(transaction)
+        assert "Transaction" in str(shared_transaction)
+        assert str(shared_transaction.listing.title) in str(shared_transaction)
 
     def test_transaction_default_status(self, two_users, listing):
         """Test default status is PENDING"""
@@ -119,14 +176,14 @@ class TestTransactionModel:
 class TestTransactionSerializer:
     """Tests for Transaction serializers"""
 
-    def test_transaction_serializer(self, transaction):
+    def test_transaction_serializer(self, shared_transaction):
         """Test TransactionSerializer serialization"""
-        serializer = TransactionSerializer(transaction)
+        serializer = TransactionSerializer(shared_transaction)
         data = serializer.data
-        assert data["transaction_id"] == transaction.transaction_id
-        assert data["buyer"] == transaction.buyer.id
-        assert data["seller"] == transaction.seller.id
-        assert data["status"] == transaction.status
+        assert data["transaction_id"] == shared_transaction.transaction_id
+        assert data["buyer"] == shared_transaction.buyer.id
+        assert data["seller"] == shared_transaction.seller.id
+        assert data["status"] == shared_transaction.status
 
     def test_payment_method_serializer_validation(self):
         """Test PaymentMethodUpdateSerializer validation"""
@@ -140,12 +197,12 @@ class TestTransactionSerializer:
         assert not serializer.is_valid()
         assert "payment_method" in serializer.errors
 
-    def test_payment_method_serializer_all_valid_methods(self):
+    @pytest.mark.parametrize("method", ["venmo", "zelle", "cash"])
+    def test_payment_method_serializer_all_valid_methods(self, method):
         """Test PaymentMethodUpdateSerializer accepts all valid methods"""
-        for method in ["venmo", "zelle", "cash"]:
-            serializer = PaymentMethodUpdateSerializer(data={"payment_method": method})
-            assert serializer.is_valid(), f"Method {method} should be valid"
-            assert serializer.validated_data["payment_method"] == method
+        serializer = PaymentMethodUpdateSerializer(data={"payment_method": method})
+        assert serializer.is_valid(), f"Method {method} should be valid"
+        assert serializer.validated_data["payment_method"] == method
 
     def test_delivery_details_serializer_meetup(self):
         """Test DeliveryDetailsUpdateSerializer for meetup"""
@@ -182,56 +239,52 @@ class TestTransactionSerializer:
 class TestTransactionPermissions:
     """Tests for transaction permission classes"""
 
-    def test_is_buyer_or_seller_permission(self, transaction, two_users):
+    def test_is_buyer_or_seller_permission(
+        self, shared_transaction, two_users, other_user
+    ):
         """Test IsBuyerOrSeller permission"""
         buyer, seller = two_users
-        permission = IsBuyerOrSeller()
+        permission = IS_BUYER_OR_SELLER
 
-        # Mock request objects
-        class MockRequest:
-            def __init__(self, user):
-                self.user = user
+        buyer_request = SimpleNamespace(user=buyer)
+        seller_request = SimpleNamespace(user=seller)
+        other_request = SimpleNamespace(user=other_user)
 
-        buyer_request = MockRequest(buyer)
-        seller_request = MockRequest(seller)
-        other_user = User.objects.create_user(
-            email="other@nyu.edu", password="test", is_email_verified=True
+        assert permission.has_object_permission(buyer_request, None, shared_transaction)
+        assert permission.has_object_permission(
+            seller_request, None, shared_transaction
+        )
+        assert not permission.has_object_permission(
+            other_request, None, shared_transaction
         )
-        other_request = MockRequest(other_user)
-
-        assert permission.has_object_permission(buyer_request, None, transaction)
-        assert permission.has_object_permission(seller_request, None, transaction)
-        assert not permission.has_object_permission(other_request, None, transaction)
 
-    def test_is_buyer_permission(self, transaction, two_users):
+    def test_is_buyer_permission(self, shared_transaction, two_users):
         """Test IsBuyer permission"""
         buyer, seller = two_users
-        permission = IsBuyer()
-
-        class MockRequest:
-            def __init__(self, user):
-                self.user = user
+        permission = IS_BUYER
 
-        buyer_request = MockRequest(buyer)
-        seller_request = MockRequest(seller)
+        buyer_request = SimpleNamespace(user=buyer)
+        seller_request = SimpleNamespace(user=seller)
 
-        assert permission.has_object_permission(buyer_request, None, transaction)
-        assert not permission.has_object_permission(seller_request, None, transaction)
+        assert permission.has_object_permission(buyer_request, None, shared_transaction)
+        assert not permission.has_object_permission(
+            seller_request, None, shared_transaction
+        )
 
-    def test_is_seller_permission(self, transaction, two_users):
+    def test_is_seller_permission(self, shared_transaction, two_users):
         """Test IsSeller permission"""
         buyer, seller = two_users
-        permission = IsSeller()
-
-        class MockRequest:
-            def __init__(self, user):
-                self.user = user
+        permission = IS_SELLER
 
-        buyer_request = MockRequest(buyer)
-        seller_request = MockRequest(seller)
+        buyer_request = SimpleNamespace(user=buyer)
+        seller_request = SimpleNamespace(user=seller)
 
-        assert not permission.has_object_permission(buyer_request, None, transaction)
-        assert permission.has_object_permission(seller_request, None, transaction)
+        assert not permission.has_object_permission(
+            buyer_request, None, shared_transaction
+        )
+        assert permission.has_object_permission(
+            seller_request, None, shared_transaction
+        )
 
 
 @pytest.mark.django_db
@@ -257,20 +310,25 @@ class TestTransactionViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["transaction_id"] == transaction.transaction_id
 
-    def test_get_queryset_filters_by_user(self, two_users, listing):
+    def test_get_queryset_filters_by_user(self, two_users, listing, other_user):
         """Test get_queryset filters transactions correctly"""
         buyer, seller = two_users
-        other_user = User.objects.create_user(
-            email="other@nyu.edu", password="test", is_email_verified=True
-        )
 
-        # Create transactions
-        transaction1 = Transaction.objects.create(
-            listing=listing, buyer=buyer, seller=seller, status="PENDING"
-        )
-        transaction2 = Transaction.objects.create(
-            listing=listing, buyer=other_user, seller=seller, status="PENDING"
-        )
+        # Create both transactions in one INSERT, then read them back since
+        # bulk_create does not set primary keys on MySQL
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    listing=listing, buyer=buyer, seller=seller, status="PENDING"
+                ),
+                Transaction(
+                    listing=listing, buyer=other_user, seller=seller, status="PENDING"
+                ),
+            ]
+        )
+        transaction1, transaction2 = Transaction.objects.filter(
+            listing=listing
+        ).order_by("pk")
 
         # Test buyer's view
         view = TransactionViewSet()
@@ -295,15 +353,13 @@ class TestTransactionViewSet:
         response = api_client.get(f"/api/v1/transactions/{transaction.transaction_id}/")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_cannot_access_other_users_transaction(self, transaction):
+    def test_cannot_access_other_users_transaction(
+        self, api_client, transaction, other_user
+    ):
         """Test that user cannot access transaction they're not part of"""
-        other_user = User.objects.create_user(
-            email="other@nyu.edu", password="test", is_email_verified=True
-        )
-        client = APIClient()
-        client.force_authenticate(user=other_user)
+        api_client.force_authenticate(user=other_user)
 
-        response = client.get(f"/api/v1/transactions/{transaction.transaction_id}/")
+        response = api_client.get(f"/api/v1/transactions/{transaction.transaction_id}/")
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
@@ -318,9 +374,9 @@ class TestBuyEndpoint:
         response = client.post(f"/api/v1/listings/{listing.listing_id}/buy/")
 
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = response.data
         assert data["buyer"] == buyer.id
-        assert data["seller"] == listing.user.id
+        assert data["seller"] == listing.user_id
         assert data["status"] == "PENDING"
         assert data["listing"] == listing.listing_id
 
@@ -328,10 +384,12 @@ class TestBuyEndpoint:
         listing.refresh_from_db()
         assert listing.status == "pending"
 
-        # Check transaction created
-        transaction = Transaction.objects.get(transaction_id=data["transaction_id"])
-        assert transaction.buyer == buyer
-        assert transaction.seller == listing.user
+        # Check transaction created; compare ids so the users are not fetched
+        transaction = Transaction.objects.only("buyer_id", "seller_id").get(
+            transaction_id=data["transaction_id"]
+        )
+        assert transaction.buyer_id == buyer.id
+        assert transaction.seller_id == listing.user_id
 
     def test_buy_own_listing_fails(self, authenticated_seller, listing):
         """Test that seller cannot buy their own listing"""
@@ -340,29 +398,27 @@ class TestBuyEndpoint:
         response = client.post(f"/api/v1/listings/{listing.listing_id}/buy/")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "cannot buy your own listing" in response.json()["error"].lower()
+        assert "cannot buy your own listing" in response.data["error"].lower()
 
     def test_buy_unavailable_listing_fails(self, authenticated_buyer, listing):
         """Test that buyer cannot buy unavailable listing"""
         client, buyer = authenticated_buyer
-        listing.status = "sold"
-        listing.save()
+        Listing.objects.filter(pk=listing.pk).update(status="sold")
 
         response = client.post(f"/api/v1/listings/{listing.listing_id}/buy/")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "not available" in response.json()["error"].lower()
+        assert "not available" in response.data["error"].lower()
 
     def test_buy_pending_listing_fails(self, authenticated_buyer, listing):
         """Test that buyer cannot buy pending listing"""
         client, buyer = authenticated_buyer
-        listing.status = "pending"
-        listing.save()
+        Listing.objects.filter(pk=listing.pk).update(status="pending")
 
         response = client.post(f"/api/v1/listings/{listing.listing_id}/buy/")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "not available" in response.json()["error"].lower()
+        assert "not available" in response.data["error"].lower()
 
     def test_buy_requires_authentication(self, api_client, listing):
         """Test that buy endpoint requires authentication"""
@@ -377,47 +433,41 @@ class TestBuyEndpoint:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
-@pytest.mark.django_db
-class TestPaymentMethodEndpoint:
-    """Tests for PATCH /api/v1/transactions/{id}/payment-method/"""
+_update_views = {
+    action: TransactionUpdateViewSet.as_view({"patch": action})
+    for action in ("payment_method", "delivery_details", "confirm", "mark_sold")
+}
 
-    def test_update_payment_method_success(self, authenticated_buyer, listing):
-        """Test successful payment method update"""
-        client, buyer = authenticated_buyer
 
-        # Create transaction
-        transaction = Transaction.objects.create(
-            listing=listing, buyer=buyer, seller=listing.user, status="PENDING"
-        )
+def _has_system_message(transaction):
+    """Whether a system chat message was posted for the transaction"""
+    return Message.objects.filter(
+        metadata__is_system=True, metadata__transaction_id=transaction.transaction_id
+    ).exists()
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/payment-method/",
-            {"payment_method": "venmo"},
-        )
 
-        assert response.status_code == status.HTTP_200_OK
-        transaction.refresh_from_db()
-        assert transaction.payment_method == "venmo"
+def _patch_action(call_view, action, transaction, user, data=None):
+    """PATCH a TransactionUpdateViewSet action directly, skipping routing.
 
-    def test_update_payment_method_zelle(self, authenticated_buyer, listing):
-        """Test updating payment method to zelle"""
-        client, buyer = authenticated_buyer
+    Each endpoint keeps one APIClient test so its URL stays covered.
+    """
+    return call_view(
+        _update_views[action],
+        "patch",
+        "/",
+        user=user,
+        data=data,
+        pk=transaction.transaction_id,
+    )
 
-        transaction = Transaction.objects.create(
-            listing=listing, buyer=buyer, seller=listing.user, status="PENDING"
-        )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/payment-method/",
-            {"payment_method": "zelle"},
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        transaction.refresh_from_db()
-        assert transaction.payment_method == "zelle"
+@pytest.mark.django_db
+class TestPaymentMethodEndpoint:
+    """Tests for PATCH /api/v1/transactions/{id}/payment-method/"""
 
-    def test_update_payment_method_cash(self, authenticated_buyer, listing):
-        """Test updating payment method to cash"""
+    @pytest.mark.parametrize("method", ["venmo", "zelle", "cash"])
+    def test_update_payment_method(self, authenticated_buyer, listing, method):
+        """Test the buyer can set each payment method"""
         client, buyer = authenticated_buyer
 
         transaction = Transaction.objects.create(
@@ -426,63 +476,59 @@ class TestPaymentMethodEndpoint:
 
         response = client.patch(
             f"/api/v1/transactions/{transaction.transaction_id}/payment-method/",
-            {"payment_method": "cash"},
+            {"payment_method": method},
         )
 
         assert response.status_code == status.HTTP_200_OK
         transaction.refresh_from_db()
-        assert transaction.payment_method == "cash"
+        assert transaction.payment_method == method
 
     def test_seller_cannot_update_payment_method(
-        self, authenticated_seller, listing, two_users
+        self, call_view, buyer, seller, listing
     ):
         """Test that seller cannot update payment method"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=seller, status="PENDING"
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/payment-method/",
+        response = _patch_action(
+            call_view,
+            "payment_method",
+            transaction,
+            seller,
             {"payment_method": "venmo"},
         )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_invalid_payment_method_fails(self, authenticated_buyer, listing):
+    def test_invalid_payment_method_fails(self, call_view, buyer, listing):
         """Test that invalid payment method is rejected"""
-        client, buyer = authenticated_buyer
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=listing.user, status="PENDING"
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/payment-method/",
+        response = _patch_action(
+            call_view,
+            "payment_method",
+            transaction,
+            buyer,
             {"payment_method": "invalid"},
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_payment_method_creates_system_message(self, authenticated_buyer, listing):
+    def test_payment_method_creates_system_message(self, call_view, buyer, listing):
         """Test that updating payment method creates system message"""
-        client, buyer = authenticated_buyer
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=listing.user, status="PENDING"
         )
 
-        initial_message_count = Message.objects.count()
-
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/payment-method/",
-            {"payment_method": "venmo"},
+        response = _patch_action(
+            call_view, "payment_method", transaction, buyer, {"payment_method": "venmo"}
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert Message.objects.count() == initial_message_count + 1
+        assert _has_system_message(transaction)
 
     def test_payment_method_nonexistent_transaction(self, authenticated_buyer):
         """Test updating payment method for non-existent transaction"""
@@ -522,16 +568,17 @@ class TestDeliveryDetailsEndpoint:
         assert transaction.delivery_method == "meetup"
         assert transaction.meet_location == "Bobst Library"
 
-    def test_update_delivery_details_pickup(self, authenticated_buyer, listing):
+    def test_update_delivery_details_pickup(self, call_view, buyer, listing):
         """Test successful delivery details update for pickup"""
-        client, buyer = authenticated_buyer
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=listing.user, status="PENDING"
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/delivery-details/",
+        response = _patch_action(
+            call_view,
+            "delivery_details",
+            transaction,
+            buyer,
             {"delivery_method": "pickup"},
         )
 
@@ -539,34 +586,35 @@ class TestDeliveryDetailsEndpoint:
         transaction.refresh_from_db()
         assert transaction.delivery_method == "pickup"
 
-    def test_meetup_requires_location_and_time(self, authenticated_buyer, listing):
+    def test_meetup_requires_location_and_time(self, call_view, buyer, listing):
         """Test that meetup requires location and time"""
-        client, buyer = authenticated_buyer
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=listing.user, status="PENDING"
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/delivery-details/",
+        response = _patch_action(
+            call_view,
+            "delivery_details",
+            transaction,
+            buyer,
             {"delivery_method": "meetup"},
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_seller_can_update_delivery_details(
-        self, authenticated_seller, listing, two_users
+        self, call_view, buyer, seller, listing
     ):
         """Seller is allowed to propose new delivery details (for negotiation flow)"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=seller, status="PENDING"
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/delivery-details/",
+        response = _patch_action(
+            call_view,
+            "delivery_details",
+            transaction,
+            seller,
             {
                 "delivery_method": "pickup",
                 "meet_location": "Kimmel Center",
@@ -579,20 +627,17 @@ class TestDeliveryDetailsEndpoint:
         assert transaction.delivery_method == "pickup"
         assert transaction.meet_location == "Kimmel Center"
 
-    def test_delivery_details_creates_system_message(
-        self, authenticated_buyer, listing
-    ):
+    def test_delivery_details_creates_system_message(self, call_view, buyer, listing):
         """Test that updating delivery details creates system message"""
-        client, buyer = authenticated_buyer
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=listing.user, status="PENDING"
         )
 
-        initial_message_count = Message.objects.count()
-
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/delivery-details/",
+        response = _patch_action(
+            call_view,
+            "delivery_details",
+            transaction,
+            buyer,
             {
                 "delivery_method": "meetup",
                 "meet_location": "Bobst Library",
@@ -601,7 +646,7 @@ class TestDeliveryDetailsEndpoint:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert Message.objects.count() == initial_message_count + 1
+        assert _has_system_message(transaction)
 
 
 @pytest.mark.django_db
@@ -609,7 +654,7 @@ class TestConfirmEndpoint:
     """Tests for PATCH /api/v1/transactions/{id}/confirm/"""
 
     def test_seller_confirms_buyer_proposal_success(
-        self, authenticated_seller, listing, two_users
+        self, authenticated_seller, listing, two_users, future_meet_time
     ):
         """
         Seller can confirm when:
@@ -627,7 +672,7 @@ class TestConfirmEndpoint:
             status="NEGOTIATING",
             delivery_method="meetup",
             meet_location="Bobst Library",
-            meet_time=timezone.now() + timedelta(hours=2),
+            meet_time=future_meet_time,
             proposed_by="buyer",
         )
 
@@ -639,13 +684,14 @@ class TestConfirmEndpoint:
         transaction.refresh_from_db()
         assert transaction.status == "SCHEDULED"
 
-    def test_buyer_confirms_seller_proposal_success(self, authenticated_buyer, listing):
+    def test_buyer_confirms_seller_proposal_success(
+        self, call_view, buyer, listing, future_meet_time
+    ):
         """
         Buyer can confirm when:
         - transaction is NEGOTIATING
         - proposed_by = 'seller'
         """
-        client, buyer = authenticated_buyer
         seller = listing.user
 
         transaction = Transaction.objects.create(
@@ -655,98 +701,61 @@ class TestConfirmEndpoint:
             status="NEGOTIATING",
             delivery_method="meetup",
             meet_location="Bobst Library",
-            meet_time=timezone.now() + timedelta(hours=2),
+            meet_time=future_meet_time,
             proposed_by="seller",
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/confirm/"
-        )
+        response = _patch_action(call_view, "confirm", transaction, buyer)
 
         assert response.status_code == status.HTTP_200_OK
         transaction.refresh_from_db()
         assert transaction.status == "SCHEDULED"
 
-    def test_confirm_without_proposal_returns_400(
-        self, authenticated_seller, listing, two_users
+    @pytest.mark.parametrize(
+        "tx_status,proposed_by,actor_role",
+        [
+            # Nothing has been proposed yet
+            ("PENDING", None, "seller"),
+            # COMPLETED (or other invalid state) cannot be confirmed
+            ("COMPLETED", "buyer", "seller"),
+            # The party who proposed cannot confirm their own proposal; this is
+            # a business rule (400), not a permission error (403)
+            ("NEGOTIATING", "buyer", "buyer"),
+        ],
+        ids=["no-proposal", "invalid-state", "own-proposal"],
+    )
+    def test_confirm_rejected(
+        self,
+        call_view,
+        buyer,
+        seller,
+        listing,
+        future_meet_time,
+        tx_status,
+        proposed_by,
+        actor_role,
     ):
-        """Confirming when there is no proposal should return 400"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
+        """Confirm returns 400 when the transaction cannot be confirmed"""
         transaction = Transaction.objects.create(
             listing=listing,
             buyer=buyer,
             seller=seller,
-            status="PENDING",
+            status=tx_status,
             delivery_method="meetup",
             meet_location="Bobst Library",
-            meet_time=timezone.now() + timedelta(hours=2),
-            proposed_by=None,
+            meet_time=future_meet_time,
+            proposed_by=proposed_by,
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/confirm/"
-        )
+        actor = buyer if actor_role == "buyer" else seller
+        response = _patch_action(call_view, "confirm", transaction, actor)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_confirm_invalid_state(self, authenticated_seller, listing, two_users):
-        """Confirming from COMPLETED (or other invalid state) should fail"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
-        transaction = Transaction.objects.create(
-            listing=listing,
-            buyer=buyer,
-            seller=seller,
-            status="COMPLETED",
-            delivery_method="meetup",
-            meet_location="Bobst Library",
-            meet_time=timezone.now() + timedelta(hours=2),
-            proposed_by="buyer",
-        )
-
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/confirm/"
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_wrong_party_cannot_confirm(self, authenticated_buyer, listing):
-        """
-        The same party who proposed details (proposed_by) cannot
-        confirm their own proposal – should return 400.
-        """
-        client, buyer = authenticated_buyer
-        seller = listing.user
-
-        transaction = Transaction.objects.create(
-            listing=listing,
-            buyer=buyer,
-            seller=seller,
-            status="NEGOTIATING",
-            delivery_method="meetup",
-            meet_location="Bobst Library",
-            meet_time=timezone.now() + timedelta(hours=2),
-            proposed_by="buyer",  # buyer proposed
-        )
-
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/confirm/"
-        )
-
-        # Buyer is part of the transaction but not allowed to confirm
-        # their own proposal -> 400 (business rule), not 403.
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
     def test_confirm_creates_system_message(
-        self, authenticated_seller, listing, two_users
+        self, call_view, buyer, seller, listing, future_meet_time
     ):
         """Successful confirm should create a system message in chat"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
         transaction = Transaction.objects.create(
             listing=listing,
             buyer=buyer,
@@ -754,31 +763,30 @@ class TestConfirmEndpoint:
             status="NEGOTIATING",
             delivery_method="meetup",
             meet_location="Bobst Library",
-            meet_time=timezone.now() + timedelta(hours=2),
+            meet_time=future_meet_time,
             proposed_by="buyer",
         )
 
-        initial_message_count = Message.objects.count()
-
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/confirm/"
-        )
+        response = _patch_action(call_view, "confirm", transaction, seller)
 
         assert response.status_code == status.HTTP_200_OK
-        assert Message.objects.count() == initial_message_count + 1
+        assert _has_system_message(transaction)
 
 
 @pytest.mark.django_db
 class TestMarkSoldEndpoint:
     """Tests for PATCH /api/v1/transactions/{id}/mark-sold/"""
 
-    def test_mark_sold_success(self, authenticated_seller, listing, two_users):
-        """Test successful mark as sold"""
+    @pytest.mark.parametrize("initial_status", ["SCHEDULED", "PENDING"])
+    def test_mark_sold_success(
+        self, authenticated_seller, listing, two_users, initial_status
+    ):
+        """Test successful mark as sold, including straight from PENDING"""
         client, seller = authenticated_seller
         buyer, _ = two_users
 
         transaction = Transaction.objects.create(
-            listing=listing, buyer=buyer, seller=seller, status="SCHEDULED"
+            listing=listing, buyer=buyer, seller=seller, status=initial_status
         )
 
         response = client.patch(
@@ -792,88 +800,46 @@ class TestMarkSoldEndpoint:
         listing.refresh_from_db()
         assert listing.status == "sold"
 
-    def test_mark_sold_from_pending(self, authenticated_seller, listing, two_users):
-        """Test marking as sold from PENDING status"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
-        transaction = Transaction.objects.create(
-            listing=listing, buyer=buyer, seller=seller, status="PENDING"
-        )
-
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/mark-sold/"
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        transaction.refresh_from_db()
-        assert transaction.status == "COMPLETED"
-
-    def test_mark_sold_already_completed(
-        self, authenticated_seller, listing, two_users
-    ):
+    def test_mark_sold_already_completed(self, call_view, buyer, seller, listing):
         """Test that marking already completed transaction fails"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=seller, status="COMPLETED"
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/mark-sold/"
-        )
+        response = _patch_action(call_view, "mark_sold", transaction, seller)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_mark_sold_cancelled(self, authenticated_seller, listing, two_users):
+    def test_mark_sold_cancelled(self, call_view, buyer, seller, listing):
         """Test that marking cancelled transaction fails"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=seller, status="CANCELLED"
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/mark-sold/"
-        )
+        response = _patch_action(call_view, "mark_sold", transaction, seller)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_buyer_cannot_mark_sold(self, authenticated_buyer, listing):
+    def test_buyer_cannot_mark_sold(self, call_view, buyer, listing):
         """Test that buyer cannot mark as sold"""
-        client, buyer = authenticated_buyer
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=listing.user, status="SCHEDULED"
         )
 
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/mark-sold/"
-        )
+        response = _patch_action(call_view, "mark_sold", transaction, buyer)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_mark_sold_creates_system_message(
-        self, authenticated_seller, listing, two_users
-    ):
+    def test_mark_sold_creates_system_message(self, call_view, buyer, seller, listing):
         """Test that marking as sold creates system message"""
-        client, seller = authenticated_seller
-        buyer, _ = two_users
-
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=seller, status="SCHEDULED"
         )
 
-        initial_message_count = Message.objects.count()
-
-        response = client.patch(
-            f"/api/v1/transactions/{transaction.transaction_id}/mark-sold/"
-        )
+        response = _patch_action(call_view, "mark_sold", transaction, seller)
 
         assert response.status_code == status.HTTP_200_OK
-        assert Message.objects.count() == initial_message_count + 1
+        assert _has_system_message(transaction)
 
 
 @pytest.mark.django_db
@@ -899,6 +865,19 @@ class TestTransactionHelpers:
 
         assert Conversation.objects.count() == 1
 
+    def test_create_system_message_updates_conversation(self, transaction):
+        """Test that create_system_message adds both participants and bumps
+        last_message_at"""
+        message = create_system_message(transaction, "Test message")
+
+        conv = message.conversation
+        conv.refresh_from_db()
+        assert conv.last_message_at == message.created_at
+        assert set(conv.participants.values_list("user_id", flat=True)) == {
+            transaction.buyer_id,
+            transaction.seller_id,
+        }
+
     def test_create_system_message_uses_existing_conversation(
         self, transaction, two_users
     ):
@@ -909,12 +888,16 @@ class TestTransactionHelpers:
             direct_key=direct_key, created_by=buyer
         )
 
+        ConversationParticipant.objects.create(conversation=existing_conv, user=buyer)
+
         create_system_message(transaction, "Test message")
 
         # Should still be 1 conversation
         assert Conversation.objects.count() == 1
         # Message should be in existing conversation
         assert Message.objects.filter(conversation=existing_conv).exists()
+        # The existing participant is kept and the missing one is added
+        assert existing_conv.participants.count() == 2
 
 
 @pytest.mark.django_db
@@ -1024,6 +1007,14 @@ class TestReviewSerializer:
         assert not serializer.is_valid()
         assert "what_went_well" in serializer.errors
 
+    def test_review_create_serializer_rejects_non_string_choices(self):
+        """Test ReviewCreateSerializer rejects objects in what_went_well"""
+        serializer = ReviewCreateSerializer(
+            data={"rating": 5, "what_went_well": [{"a": 1}]}
+        )
+        assert not serializer.is_valid()
+        assert "what_went_well" in serializer.errors
+
     def test_review_create_serializer_all_valid_choices(self):
         """Test ReviewCreateSerializer accepts all valid choices"""
         valid_choices = ["punctuality", "communication", "pricing", "item_description"]
@@ -1055,14 +1046,10 @@ class TestReviewPermissions:
             transaction=transaction, reviewer=buyer, rating=5
         )
 
-        permission = IsReviewer()
+        permission = IS_REVIEWER
 
-        class MockRequest:
-            def __init__(self, user):
-                self.user = user
-
-        buyer_request = MockRequest(buyer)
-        seller_request = MockRequest(seller)
+        buyer_request = SimpleNamespace(user=buyer)
+        seller_request = SimpleNamespace(user=seller)
 
         assert permission.has_object_permission(buyer_request, None, review)
         assert not permission.has_object_permission(seller_request, None, review)
@@ -1093,7 +1080,7 @@ class TestReviewViewSet:
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = response.data
         assert data["rating"] == 5
         assert data["transaction"] == transaction.transaction_id
         assert data["reviewer"] == buyer.id
@@ -1111,7 +1098,7 @@ class TestReviewViewSet:
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "transaction_id" in response.json()["error"].lower()
+        assert "transaction_id" in response.data["error"].lower()
 
     def test_create_review_nonexistent_transaction(self, authenticated_buyer):
         """Test creating review for non-existent transaction fails"""
@@ -1145,7 +1132,7 @@ class TestReviewViewSet:
         )
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
-        assert "buyer" in response.json()["error"].lower()
+        assert "buyer" in response.data["error"].lower()
 
     def test_create_review_not_completed(self, authenticated_buyer, listing, two_users):
         """Test cannot review non-completed transaction"""
@@ -1167,7 +1154,7 @@ class TestReviewViewSet:
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "completed" in response.json()["error"].lower()
+        assert "completed" in response.data["error"].lower()
 
     def test_create_review_already_exists(
         self, authenticated_buyer, listing, two_users
@@ -1193,7 +1180,7 @@ class TestReviewViewSet:
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "already exists" in response.json()["error"].lower()
+        assert "already exists" in response.data["error"].lower()
 
     def test_create_review_invalid_rating(
         self, authenticated_buyer, listing, two_users
@@ -1260,15 +1247,14 @@ class TestReviewViewSet:
         response = client.get(f"/api/v1/reviews/{review.review_id}/")
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.json()["review_id"] == review.review_id
+        assert response.data["review_id"] == review.review_id
 
     def test_retrieve_review_as_seller(self, authenticated_seller, listing, two_users):
         """Test seller can retrieve review"""
         _, seller = two_users
         buyer, _ = two_users
 
-        client = APIClient()
-        client.force_authenticate(user=seller)
+        client, _ = authenticated_seller
 
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=seller, status="COMPLETED"
@@ -1282,12 +1268,11 @@ class TestReviewViewSet:
 
         assert response.status_code == status.HTTP_200_OK
 
-    def test_retrieve_review_unauthorized(self, listing, two_users):
+    def test_retrieve_review_unauthorized(
+        self, api_client, listing, two_users, other_user
+    ):
         """Test unauthorized user cannot retrieve review"""
         buyer, seller = two_users
-        other_user = User.objects.create_user(
-            email="other@nyu.edu", password="test", is_email_verified=True
-        )
 
         transaction = Transaction.objects.create(
             listing=listing, buyer=buyer, seller=seller, status="COMPLETED"
@@ -1297,10 +1282,9 @@ class TestReviewViewSet:
             transaction=transaction, reviewer=buyer, rating=5
         )
 
-        client = APIClient()
-        client.force_authenticate(user=other_user)
+        api_client.force_authenticate(user=other_user)
 
-        response = client.get(f"/api/v1/reviews/{review.review_id}/")
+        response = api_client.get(f"/api/v1/reviews/{review.review_id}/")
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
@@ -1406,24 +1390,33 @@ class TestReviewViewSet:
         client, buyer = authenticated_buyer
         _, seller = two_users
 
-        transaction1 = Transaction.objects.create(
-            listing=listing, buyer=buyer, seller=seller, status="COMPLETED"
-        )
-        transaction2 = Transaction.objects.create(
-            listing=listing, buyer=buyer, seller=seller, status="COMPLETED"
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    listing=listing, buyer=buyer, seller=seller, status="COMPLETED"
+                )
+                for _ in range(2)
+            ]
         )
+        # bulk_create does not set primary keys on MySQL; read the rows back
+        transaction1, transaction2 = Transaction.objects.filter(
+            listing=listing
+        ).order_by("pk")
 
-        review1 = Review.objects.create(
-            transaction=transaction1, reviewer=buyer, rating=5
+        Review.objects.bulk_create(
+            [
+                Review(transaction=transaction1, reviewer=buyer, rating=5),
+                Review(transaction=transaction2, reviewer=buyer, rating=4),
+            ]
         )
-        Review.objects.create(transaction=transaction2, reviewer=buyer, rating=4)
+        review1 = Review.objects.get(transaction=transaction1)
 
         response = client.get(
             f"/api/v1/reviews/?transaction_id={transaction1.transaction_id}"
         )
 
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = response.data
         assert len(data) == 1
         assert data[0]["review_id"] == review1.review_id
 
@@ -1449,7 +1442,7 @@ class TestReviewViewSet:
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = response.data
         assert data["what_went_well"] == []
 
     def test_create_review_without_comments(
@@ -1474,5 +1467,5 @@ class TestReviewViewSet:
         )
 
         assert response.status_code == status.HTTP_201_CREATED
-        data = response.json()
+        data = response.data
         assert data["additional_comments"] is None
@@ -1,5 +1,5 @@
 from django.db import transaction as db_transaction
-from django.db.models import Q
+from django.db.models import Case, CharField, Q, Value, When
 from django.shortcuts import get_object_or_404
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
@@ -55,8 +55,15 @@ class TransactionViewSet(viewsets.ReadOnlyModelViewSet):
         user = self.request.user
         return (
             Transaction.objects.filter(Q(buyer=user) | Q(seller=user))
-            .select_related("listing")
+            .select_related("listing", "buyer", "review__reviewer")
             .prefetch_related("listing__images")
+            .annotate(
+                viewer_role=Case(
+                    When(buyer_id=user.id, then=Value("buyer")),
+                    When(seller_id=user.id, then=Value("seller")),
+                    output_field=CharField(),
+                )
+            )
         )
 
     @action(
@@ -30,3 +30,14 @@ except Exception:
 def _media_settings(tmp_path, settings):
     settings.MEDIA_ROOT = tmp_path / "media"
     return settings
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _fast_password_hasher():
+    # PBKDF2 is deliberately slow; tests never need a strong hash. Session
+    # scoped so users created by class/module fixtures get it too.
+    from django.test import override_settings
+
+    fast_hasher = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    with override_settings(PASSWORD_HASHERS=fast_hasher):
+        yield
@@ -149,6 +149,8 @@ AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
 AWS_S3_REGION_NAME = os.environ.get("AWS_S3_REGION_NAME", "us-east-1")
 AWS_STORAGE_BUCKET_NAME = os.environ.get("AWS_STORAGE_BUCKET_NAME")
+# Run S3 cleanup on a worker thread instead of inside the request
+S3_CLEANUP_ASYNC = os.environ.get("S3_CLEANUP_ASYNC", "True") == "True"
 
 # Cache Configuration (for OTP storage)
 CACHES = {
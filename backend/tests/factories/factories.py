@@ -1,5 +1,6 @@
 import factory
 from apps.listings.models import Listing, ListingImage
+from apps.transactions.models import Transaction
 from apps.users.models import User
 
 
@@ -41,3 +42,13 @@ class ListingImageFactory(factory.django.DjangoModelFactory):
 
     listing = factory.SubFactory(ListingFactory)
     image_url = "http://example.com/image.png"
+
+
+class TransactionFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Transaction
+
+    listing = factory.SubFactory(ListingFactory)
+    buyer = factory.SubFactory(UserFactory)
+    seller = factory.SelfAttribute("listing.user")
+    status = "PENDING"
@@ -0,0 +1,52 @@
+"""orjson-backed drop-in replacements for DRF's JSON renderer and parser."""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Datetimes go through DRF's encoder so they keep its format (milliseconds,
+# "Z" for UTC), as do Decimals, lazy strings and the other types it handles.
+_fallback = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Render JSON with orjson, in the same compact form as JSONRenderer.
+
+    The output matches DRF's for the data our views return. Two differences
+    remain: NaN and infinite floats render as null where DRF's strict mode
+    raises, and the UNICODE_JSON = False setting is honoured by falling back
+    to DRF's renderer, since orjson always writes UTF-8.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # Indented output is only asked for when debugging, and orjson cannot
+        # escape non-ASCII text; keep DRF's renderer for both
+        if self.ensure_ascii or self.get_indent(
+            accepted_media_type, renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(
+            data,
+            default=_fallback,
+            # Non-string keys (e.g. the list indexes in ListField errors)
+            # become strings, as in json.dumps
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # Escape the JavaScript line terminators, as JSONRenderer does
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class ORJSONParser(JSONParser):
+    """Parse JSON request bodies with orjson."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,32 @@
+"""Filter backends shared across apps."""
+
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class LazyDjangoFilterBackend(DjangoFilterBackend):
+    """DjangoFilterBackend that skips the FilterSet when nothing can filter.
+
+    With ``filterset_fields`` the stock backend builds a new FilterSet class
+    on every request, then a form, just to find no filter parameters. This
+    backend returns the queryset as-is when none of the view's filter names
+    appear in the query string.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        names = self.get_filter_names(view)
+        if names is not None and names.isdisjoint(request.query_params):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+    @staticmethod
+    def get_filter_names(view):
+        """Query parameter names the view filters on, or None if unknown."""
+        filterset_class = getattr(view, "filterset_class", None)
+        if filterset_class is not None:
+            return set(filterset_class.base_filters)
+        filterset_fields = getattr(view, "filterset_fields", None)
+        if isinstance(filterset_fields, (list, tuple)):
+            return set(filterset_fields)
+        # A dict of lookups generates names like "price__gt"; let the
+        # FilterSet work them out
+        return None
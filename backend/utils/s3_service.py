@@ -1,5 +1,6 @@
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.exceptions import ClientError
@@ -12,6 +13,9 @@ logger = logging.getLogger(__name__)
 class S3Service:
     """Generic service class for handling S3 image operations"""
 
+    # DeleteObjects accepts at most 1000 keys per request
+    MAX_DELETE_BATCH_SIZE = 1000
+
     def __init__(self):
         self.s3_client = boto3.client(
             "s3",
@@ -99,6 +103,50 @@ class S3Service:
             logger.error(f"Unexpected error deleting image: {str(e)}")
             return False
 
+    def delete_images(self, image_urls):
+        """
+        Delete several images from S3 using batched DeleteObjects requests
+
+        Args:
+            image_urls: Iterable of public image URLs to delete
+
+        Returns:
+            int: Number of objects S3 reported as deleted
+        """
+        keys = []
+        for image_url in image_urls:
+            key = self._extract_key_from_url(image_url)
+            if key:
+                keys.append(key)
+            else:
+                logger.warning(f"Could not extract key from URL: {image_url}")
+
+        deleted = 0
+        for start in range(0, len(keys), self.MAX_DELETE_BATCH_SIZE):
+            batch = keys[start : start + self.MAX_DELETE_BATCH_SIZE]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except ClientError as e:
+                logger.error(f"Error deleting images from S3: {str(e)}")
+                continue
+            except Exception as e:
+                logger.error(f"Unexpected error deleting images: {str(e)}")
+                continue
+
+            errors = response.get("Errors", [])
+            for error in errors:
+                logger.error(
+                    f"Error deleting image from S3: {error.get('Key')}: "
+                    f"{error.get('Message')}"
+                )
+            deleted += len(batch) - len(errors)
+
+        logger.info(f"Successfully deleted {deleted} images from S3")
+        return deleted
+
     def _extract_key_from_url(self, url):
         """Extract S3 key from public URL"""
         try:
@@ -169,6 +217,34 @@ def _reset_s3_service():
     _s3_service_instance = None
 
 
+# Worker threads for S3 cleanup that should not hold up a request
+_cleanup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="s3-cleanup")
+
+
+def delete_images_in_background(image_urls):
+    """
+    Delete images from S3 without blocking the caller.
+
+    Runs inline when settings.S3_CLEANUP_ASYNC is False.
+
+    Returns:
+        Future for the deleted-object count, or the count itself when inline
+    """
+    image_urls = list(image_urls)
+    if not getattr(settings, "S3_CLEANUP_ASYNC", True):
+        return _delete_images_quietly(image_urls)
+    return _cleanup_executor.submit(_delete_images_quietly, image_urls)
+
+
+def _delete_images_quietly(image_urls):
+    """Run delete_images, logging instead of raising on failure"""
+    try:
+        return get_s3_service().delete_images(image_urls)
+    except Exception as e:
+        logger.error(f"Failed to delete images from S3: {str(e)}")
+        return 0
+
+
 # Backwards compatibility: expose as s3_service
 class _S3ServiceProxy:
     """Proxy that delegates to the lazy singleton"""
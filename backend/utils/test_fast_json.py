@@ -0,0 +1,65 @@
+import datetime
+import uuid
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from utils.fast_json import ORJSONParser, ORJSONRenderer
+
+
+def test_renderer_matches_drf_output():
+    """
+    Verify that the orjson renderer emits the same bytes as DRF's renderer.
+    """
+    data = {
+        "name": "Zoë",
+        "price": Decimal("9.99"),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "created": datetime.datetime(
+            2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+        ),
+        "items": [1, 2.5, None, True],
+    }
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renderer_matches_drf_line_terminators_and_int_keys():
+    """
+    Verify that U+2028/U+2029 are escaped and int keys become strings, as in DRF.
+    """
+    data = {"bio": "line\u2028break\u2029end", "errors": {0: ["Invalid."]}}
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renderer_handles_empty_and_indented_output():
+    """
+    Verify that None renders as an empty body and indentation is honoured.
+    """
+    renderer = ORJSONRenderer()
+
+    assert renderer.render(None) == b""
+    indented = renderer.render({"a": 1}, "application/json; indent=2")
+    assert indented == b'{\n  "a": 1\n}'
+
+
+def test_parser_matches_drf_output():
+    """
+    Verify that the orjson parser decodes bodies like DRF's parser.
+    """
+    body = b'{"full_name": "Zo\\u00eb", "tags": [1, 2], "bio": null}'
+
+    assert ORJSONParser().parse(BytesIO(body)) == JSONParser().parse(BytesIO(body))
+
+
+def test_parser_rejects_invalid_json():
+    """
+    Verify that malformed bodies raise DRF's ParseError.
+    """
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(BytesIO(b"{not json"))
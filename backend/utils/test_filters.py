@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+from django_filters.rest_framework import DjangoFilterBackend
+
+from utils.filters import LazyDjangoFilterBackend
+
+
+def _view(**attrs):
+    """Build a bare view object carrying only the given filter attributes."""
+    return type("View", (), attrs)()
+
+
+def test_lazy_backend_skips_filterset_without_filter_params():
+    """
+    Verify that no FilterSet is built when no filter parameter is present.
+    """
+    request = MagicMock(query_params={"search": "alice", "ordering": "username"})
+    queryset = object()
+    view = _view(filterset_fields=["username", "user"])
+
+    with patch.object(DjangoFilterBackend, "filter_queryset") as parent:
+        result = LazyDjangoFilterBackend().filter_queryset(request, queryset, view)
+
+    assert result is queryset
+    parent.assert_not_called()
+
+
+def test_lazy_backend_filters_when_a_filter_param_is_present():
+    """
+    Verify that the stock backend runs when a filter parameter is present.
+    """
+    request = MagicMock(query_params={"username": "alice"})
+    view = _view(filterset_fields=["username", "user"])
+
+    with patch.object(DjangoFilterBackend, "filter_queryset") as parent:
+        result = LazyDjangoFilterBackend().filter_queryset(request, "qs", view)
+
+    assert result is parent.return_value
+    parent.assert_called_once()
+
+
+def test_lazy_backend_filter_names():
+    """
+    Verify filter names for filterset classes, field lists and lookup dicts.
+    """
+    filterset_class = MagicMock(base_filters={"min_price": None, "category": None})
+
+    names = LazyDjangoFilterBackend.get_filter_names
+    assert names(_view(filterset_class=filterset_class)) == {"min_price", "category"}
+    assert names(_view(filterset_fields=["user"])) == {"user"}
+    assert names(_view(filterset_fields={"price": ["gt"]})) is None
+    assert names(_view()) is None
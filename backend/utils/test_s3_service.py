@@ -3,6 +3,7 @@ from botocore.exceptions import ClientError
 from unittest.mock import MagicMock, patch
 from utils.s3_service import (
     S3Service,
+    delete_images_in_background,
     get_s3_service,
     _reset_s3_service,
     s3_service as s3_service_proxy,
@@ -140,6 +141,77 @@ def test_delete_image_invalid_url(mock_settings, s3_service):
     assert success is False
 
 
+@patch("utils.s3_service.settings")
+def test_delete_images_batches_keys(mock_settings, s3_service):
+    """
+    Verify that delete_images sends keys in DeleteObjects batches of at most 1000.
+    """
+    mock_settings.AWS_S3_REGION_NAME = "us-east-1"
+    s3_service.s3_client.delete_objects.return_value = {}
+    base = f"https://{s3_service.bucket_name}.s3.us-east-1.amazonaws.com/"
+    image_urls = [f"{base}listings/1/{i}.jpg" for i in range(1001)]
+
+    deleted = s3_service.delete_images(image_urls)
+
+    assert deleted == 1001
+    calls = s3_service.s3_client.delete_objects.call_args_list
+    assert len(calls) == 2
+    assert len(calls[0].kwargs["Delete"]["Objects"]) == 1000
+    assert calls[1].kwargs["Delete"]["Objects"] == [{"Key": "listings/1/1000.jpg"}]
+    assert calls[1].kwargs["Bucket"] == s3_service.bucket_name
+
+
+@patch("utils.s3_service.settings")
+def test_delete_images_skips_invalid_urls_and_counts_errors(mock_settings, s3_service):
+    """
+    Verify that unparseable URLs are skipped and per-key errors are not counted.
+    """
+    mock_settings.AWS_S3_REGION_NAME = "us-east-1"
+    s3_service.s3_client.delete_objects.return_value = {
+        "Errors": [{"Key": "listings/1/b.jpg", "Message": "Access Denied"}]
+    }
+    base = f"https://{s3_service.bucket_name}.s3.us-east-1.amazonaws.com/"
+
+    deleted = s3_service.delete_images(
+        [
+            f"{base}listings/1/a.jpg",
+            "http://invalid-url.com/x.jpg",
+            f"{base}listings/1/b.jpg",
+        ]
+    )
+
+    assert deleted == 1
+    s3_service.s3_client.delete_objects.assert_called_once_with(
+        Bucket=s3_service.bucket_name,
+        Delete={
+            "Objects": [{"Key": "listings/1/a.jpg"}, {"Key": "listings/1/b.jpg"}],
+            "Quiet": True,
+        },
+    )
+
+
+@patch("utils.s3_service.settings")
+def test_delete_images_client_error(mock_settings, s3_service):
+    """
+    Verify that a failed DeleteObjects request is caught and handled.
+    """
+    mock_settings.AWS_S3_REGION_NAME = "us-east-1"
+    s3_service.s3_client.delete_objects.side_effect = ClientError(
+        {"Error": {"Code": "500", "Message": "Internal Error"}}, "delete_objects"
+    )
+    image_url = f"https://{s3_service.bucket_name}.s3.us-east-1.amazonaws.com/a.jpg"
+
+    assert s3_service.delete_images([image_url]) == 0
+
+
+def test_delete_images_empty(s3_service):
+    """
+    Verify that no request is made when there is nothing to delete.
+    """
+    assert s3_service.delete_images([]) == 0
+    s3_service.s3_client.delete_objects.assert_not_called()
+
+
 @patch("utils.s3_service.Image.open")
 def test_upload_image_generic_exception(mock_image_open, s3_service):
     """
@@ -310,3 +382,28 @@ def test_get_s3_service_singleton_and_proxy(mock_settings, mock_boto_client):
     _reset_s3_service()
     third = get_s3_service()
     assert third is not first
+
+
+@patch("utils.s3_service.get_s3_service")
+def test_delete_images_in_background_runs_on_worker_thread(mock_get_s3, settings):
+    """
+    Verify that background cleanup returns a future for the deleted count.
+    """
+    settings.S3_CLEANUP_ASYNC = True
+    mock_get_s3.return_value.delete_images.return_value = 2
+
+    future = delete_images_in_background(iter(["a.jpg", "b.jpg"]))
+
+    assert future.result(timeout=5) == 2
+    mock_get_s3.return_value.delete_images.assert_called_once_with(["a.jpg", "b.jpg"])
+
+
+@patch("utils.s3_service.get_s3_service")
+def test_delete_images_in_background_inline_swallows_errors(mock_get_s3, settings):
+    """
+    Verify that inline cleanup logs failures instead of raising them.
+    """
+    settings.S3_CLEANUP_ASYNC = False
+    mock_get_s3.return_value.delete_images.side_effect = Exception("S3 down")
+
+    assert delete_images_in_background(["a.jpg"]) == 0